@@ -3,46 +3,185 @@ Run dash applications with a context manager.
 When exiting the context, the server will close.
 """
 from __future__ import print_function
+import collections
+import os
+import pkgutil
 import runpy
 import shlex
+import socket
 import subprocess
+import tempfile
 import time
-import uuid
 import threading
 import sys
 
-import flask
-import requests
+import six
 
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.support.wait import WebDriverWait
+try:
+    from importlib.util import find_spec
+except ImportError:  # pragma: no cover
+    # Python 2, pkgutil.get_loader is removed from python 3.14.
+    find_spec = None
 
 from pytest_dash import errors
-from pytest_dash.wait_for import _wait_for_client_app_started
+from pytest_dash.instrumentation import (
+    RequestLog, RequestRecorder, _app_env, _log_env
+)
+from pytest_dash.servers import create_server
+from pytest_dash.wait_for import (
+    _wait_for_client_app_started, _wait_for_server_closed
+)
 
+# Not available on python 2, an empty tuple catches nothing.
+_TimeoutExpired = getattr(subprocess, 'TimeoutExpired', ())
 
-def _stop_server():
-    stopper = flask.request.environ['werkzeug.server.shutdown']
-    stopper()
-    return 'stop'
 
+def _wait_for_process(process, timeout):
+    # Wait for the process to exit, return False if it's still running.
+    try:
+        process.wait(timeout=timeout)
+    except TypeError:  # pragma: no cover
+        # Python 2 Popen.wait has no timeout.
+        deadline = time.time() + timeout
+        while process.poll() is None and time.time() < deadline:
+            time.sleep(0.01)
+    except _TimeoutExpired:
+        pass
+    return process.poll() is not None
+
+
+def _worker_port_range(port_range):
+    # Split the port range in equal slices for each xdist worker.
+    worker = os.environ.get('PYTEST_XDIST_WORKER')
+    count = int(os.environ.get('PYTEST_XDIST_WORKER_COUNT', 1))
+    start, end = port_range
+    if not worker or count <= 1:
+        return start, end
+
+    index = int(worker.lstrip('gw'))
+    size = (end - start + 1) // count
+    if size < 1:
+        raise errors.PortAllocationError(
+            'Port range {}-{} is too small for {} workers'.format(
+                start, end, count
+            )
+        )
+    start = start + index * size
+    return start, start + size - 1
 
-def _assert_closed(driver):
-    driver.refresh()
-    body = driver.find_element_by_css_selector('body').text
-    return 'refused to connect' in body or not body
 
+def _can_bind(host, port, reuse_address=False):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        if reuse_address:
+            # Like the servers, ignore the closed connections in TIME_WAIT.
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+    except socket.error:
+        return False
+    finally:
+        sock.close()
+    return True
+
+
+def find_free_port(port_range=None, host='127.0.0.1'):
+    """
+    Find a port available for a dash server.
+
+    Without a range, the OS assign an ephemeral port.
+    With a range, the first port that can be bound is returned,
+    the range is split between the workers when running with pytest-xdist.
+
+    :param port_range: Inclusive (start, end) ports to search.
+    :type port_range: tuple
+    :param host: Interface to bind to check the port.
+    :type host: str
+    :raise: pytest_dash.errors.PortAllocationError
+    :return: A free port.
+    :rtype: int
+    """
+    if not port_range:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.bind((host, 0))
+            return sock.getsockname()[1]
+        finally:
+            sock.close()
+
+    start, end = _worker_port_range(port_range)
+    for port in range(start, end + 1):
+        if _can_bind(host, port):
+            return port
+
+    raise errors.PortAllocationError(
+        'No free port found in range {}-{}'.format(start, end)
+    )
+
+
+class _ImportCache(object):
+    """Globals of the imported app modules with the file mtime."""
+
+    def __init__(self):
+        self.enabled = False
+        self.modules = {}
+
+    @staticmethod
+    def _mtime(module_name):
+        if find_spec is not None:
+            spec = find_spec(module_name)
+            path = spec.origin if spec and spec.has_location else None
+        else:  # pragma: no cover
+            loader = pkgutil.get_loader(module_name)
+            path = loader.get_filename(module_name) if loader else None
+        return os.path.getmtime(path) if path else None
+
+    def get(self, module_name):
+        """
+        :param module_name: Dot notation path of the module.
+        :type module_name: str
+        :return: The cached globals of the module, None if it's not cached
+            or the module file changed.
+        :rtype: dict
+        """
+        cached = self.modules.get(module_name)
+        if cached and cached[0] == self._mtime(module_name):
+            return cached[1]
+        return None
+
+    def set(self, module_name, module_globals):
+        """
+        Cache the globals of an executed module with its file mtime.
 
-def _handle_error(_):
-    _stop_server()
+        :param module_name: Dot notation path of the module.
+        :type module_name: str
+        :param module_globals: Globals of the executed module.
+        :type module_globals: dict
+        :return:
+        """
+        self.modules[module_name] = (self._mtime(module_name), module_globals)
 
+    def clear(self):
+        """
+        Remove all the cached modules.
 
-def import_app(app_file, application_name='app'):
+        :return:
+        """
+        self.modules.clear()
+
+
+_import_cache = _ImportCache()
+
+
+def import_app(app_file, application_name='app', cache=None, fresh=False):
     """
     Import a dash application from a module.
     The import path is in dot notation to the module.
     The variable named app will be returned.
 
+    With the cache, the module is executed once and the same app instance
+    is returned until the module file is modified. The cache is enabled
+    for all imports with the ``dash_cache_imports`` option.
+
     :Example:
 
         >>> app = import_app('my_app.app')
@@ -52,12 +191,26 @@ def import_app(app_file, application_name='app'):
     :param app_file: Path to the app (dot-separated).
     :type app_file: str
     :param application_name: The name of the dash application instance.
+    :param cache: Use the imported apps cache, default to the
+        ``dash_cache_imports`` option.
+    :type cache: bool
+    :param fresh: Execute the module again even if it's cached.
+    :type fresh: bool
     :raise: pytest_dash.errors.NoAppFoundError
     :return: App from module.
     :rtype: dash.Dash
     """
+    if cache is None:
+        cache = _import_cache.enabled
+
+    app_module = _import_cache.get(app_file) \
+        if cache and not fresh else None
+
     try:
-        app_module = runpy.run_module(app_file)
+        if app_module is None:
+            app_module = runpy.run_module(app_file)
+            if cache:
+                _import_cache.set(app_file, app_module)
         app = app_module[application_name]
     except KeyError:
         raise errors.NoAppFoundError(
@@ -69,17 +222,29 @@ def import_app(app_file, application_name='app'):
 class BaseDashRunner(object):
     """Base context manager class for running applications."""
 
-    def __init__(self, driver, keep_open=False):
+    def __init__(
+            self, driver, keep_open=False, port_range=None,
+            record_requests=False
+    ):
         """
         :param driver: Selenium driver
         :type driver: selenium.webdriver.remote.webdriver.WebDriver
         :param keep_open: Keep the server open
         :type keep_open: bool
+        :param port_range: Inclusive (start, end) ports to use with
+            ``port='auto'``, an ephemeral port is used if not set.
+        :type port_range: tuple
+        :param record_requests: Record the requests of the server in
+            ``recorded_requests``.
+        :type record_requests: bool
         """
         self.driver = driver
         self.port = 8050
         self.started = False
         self.keep_open = keep_open
+        self.port_range = port_range
+        self.stop_timeout = 5
+        self.recorded_requests = RequestLog() if record_requests else None
 
     def start(self, *args, **kwargs):
         """
@@ -99,21 +264,53 @@ class BaseDashRunner(object):
         """
         raise NotImplementedError  # pragma: no cover
 
+    def report_sections(self, since=None):
+        """
+        Sections to add to the report of a failed test using this runner.
+
+        :param since: Start time of the test.
+        :type since: float
+        :return: List of ``(title, content)``.
+        :rtype: list
+        """
+        if self.recorded_requests is None:
+            return []
+        summary = self.recorded_requests.summary(since)
+        if not summary:
+            return []
+        return [('Recorded dash requests', summary)]
+
+    def reload(self):
+        """
+        Load the application in the browser again and wait until it's ready.
+
+        :return:
+        """
+        _wait_for_client_app_started(self.driver, self.url)
+
     def __call__(self, *args, **kwargs):
         return self.start(*args, **kwargs)
 
+    def _resolve_port(self, port):
+        if port == 'auto':
+            return find_free_port(self.port_range)
+        return int(port)
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.started and not self.keep_open:
-            self.stop()
-            try:
-                WebDriverWait(self.driver, 1).until(_assert_closed)
-            except TimeoutException:  # pragma: no cover
-                raise errors.ServerCloseError(
-                    'Could not stop server (port={})'.format(self.port)
-                )
+            self._shutdown()
+
+    def _shutdown(self):
+        # Stop the server and wait until the port is closed.
+        self.stop()
+        self.started = False
+        if not _wait_for_server_closed(self.url, self.stop_timeout):
+            raise errors.ServerCloseError(  # pragma: no cover
+                'Could not stop server (port={})'.format(self.port)
+            )
 
     @property
     def url(self):
@@ -128,42 +325,126 @@ class BaseDashRunner(object):
 class DashThreaded(BaseDashRunner):
     """Runs a dash application in a thread."""
 
-    def __init__(self, driver, keep_open=False):
-        super(DashThreaded, self).__init__(driver, keep_open=keep_open)
-        self.stop_route = '/_stop-{}'.format(uuid.uuid4().hex)
+    def __init__(
+            self,
+            driver,
+            keep_open=False,
+            port_range=None,
+            backend='werkzeug',
+            threads=4,
+            record_requests=False
+    ):
+        """
+        :param driver: Selenium driver
+        :type driver: selenium.webdriver.remote.webdriver.WebDriver
+        :param keep_open: Keep the server open
+        :type keep_open: bool
+        :param port_range: Inclusive (start, end) ports for ``port='auto'``.
+        :type port_range: tuple
+        :param backend: Default server backend,
+            ``werkzeug``, ``waitress`` or ``wsgiref``.
+        :type backend: str
+        :param threads: Default number of threads for the waitress backend.
+        :type threads: int
+        :param record_requests: Record the requests of the server in
+            ``recorded_requests``.
+        :type record_requests: bool
+        """
+        super(DashThreaded, self).__init__(
+            driver,
+            keep_open=keep_open,
+            port_range=port_range,
+            record_requests=record_requests
+        )
+        self.server = None
         self.thread = None
+        self.app = None
+        self.reset_hooks = []
+        # Defaults of `start`, the start waits are kept for the reloads
+        # with the backend and threads of the running server.
+        self._options = {
+            'backend': backend,
+            'threads': threads,
+            'start_wait_time': None,
+            'start_timeout': None,
+            'server': None,
+        }
 
     # pylint: disable=arguments-differ
     def start(
-            self, app, port=8050, start_wait_time=0.5, start_timeout=10,
+            self,
+            app,
+            port=8050,
+            start_wait_time=None,
+            start_timeout=None,
+            backend=None,
+            threads=None,
             **kwargs
     ):
         """
         Start the threaded dash app server.
 
+        If the server is already running the same app with the same port
+        (or ``'auto'``), backend and threads, the page is only reloaded,
+        otherwise the server is restarted.
+
         .. seealso:: :py:func:`~.plugin.dash_threaded`
 
         :param app: The dash application instance.
         :type app: dash.Dash
-        :param port: Port of the dash application.
-        :type port: int
-        :param start_wait_time: Poll rate for the server started wait
+        :param port: Port of the dash application, ``'auto'`` to use a
+            free port.
+        :type port: int|str
+        :param start_wait_time: Poll rate for the server started wait,
+            default to the ``dash_poll_frequency`` option.
         :type start_wait_time: float
-        :param start_timeout: Max time to start the server.
+        :param start_timeout: Max time to start the server, default to the
+            ``dash_wait_timeout`` option.
         :type start_timeout: float
+        :param backend: The server backend,
+            ``werkzeug``, ``waitress`` or ``wsgiref``.
+        :type backend: str
+        :param threads: Number of threads for the waitress backend.
+        :type threads: int
         :param kwargs:
         :return:
         """
-        app.server.add_url_rule(self.stop_route, self.stop_route, _stop_server)
-        self.port = port
-        app.server.errorhandler(500)(_handle_error)
-
-        def run():
-            app.scripts.config.serve_locally = True
-            app.css.config.serve_locally = True
-            app.run_server(debug=False, port=port, threaded=True)
+        self._options.update(
+            start_wait_time=start_wait_time, start_timeout=start_timeout
+        )
 
-        self.thread = threading.Thread(target=run)
+        server_options = (
+            backend or self._options['backend'],
+            threads or self._options['threads'],
+        )
+        if self.started:
+            same_port = port == 'auto' or int(port) == self.port
+            if app is self.app and same_port and \
+                    server_options == self._options['server']:
+                # Already serving this app, only reload the page.
+                self.reload()
+                return app
+            # Another app or other server arguments, restart the server.
+            self._shutdown()
+
+        self.app = app
+        self.port = self._resolve_port(port)
+        self._options['server'] = server_options
+        app.scripts.config.serve_locally = True
+        app.css.config.serve_locally = True
+
+        wsgi_app = app.server
+        if self.recorded_requests is not None:
+            wsgi_app = RequestRecorder(wsgi_app, log=self.recorded_requests)
+
+        self.server = create_server(
+            server_options[0],
+            wsgi_app,
+            '127.0.0.1',
+            self.port,
+            threads=server_options[1]
+        )
+        self.thread = threading.Thread(target=self.server.serve_forever)
 
         self.thread.daemon = True
         self.thread.start()
@@ -179,18 +460,123 @@ class DashThreaded(BaseDashRunner):
 
         return app
 
+    def reload(self):
+        _wait_for_client_app_started(
+            self.driver, self.url, self._options['start_wait_time'],
+            self._options['start_timeout']
+        )
+
+    def reset(self, layout=None):
+        """
+        Reset the state of the running application and reload the page.
+
+        The ``reset_hooks`` are called with the app before the reload,
+        add functions to clear the server side state of the app.
+
+        :param layout: New layout to set on the app.
+        :raise: pytest_dash.errors.ServerNotStartedError
+        :return:
+        """
+        if not self.started:
+            raise errors.ServerNotStartedError(
+                'Start the dash application before resetting it.'
+            )
+        if layout is not None:
+            self.app.layout = layout
+        for hook in self.reset_hooks:
+            hook(self.app)
+        self.reload()
+
     def stop(self):
-        requests.get('{}{}'.format(self.url, self.stop_route))
-        while self.thread.is_alive():
-            time.sleep(0.1)
+        self.server.shutdown()
+        self.thread.join(self.stop_timeout)
+        if self.thread.is_alive():
+            raise errors.ServerCloseError(  # pragma: no cover
+                'Server thread did not stop (port={})'.format(self.port)
+            )
+
+
+def _format_output_line(entry):
+    timestamp, name, line = entry
+    return '{}.{:03d} [{}] {}'.format(
+        time.strftime('%H:%M:%S', time.localtime(timestamp)),
+        int(timestamp % 1 * 1000), name, line
+    )
+
+
+class _OutputReader(object):  # pylint: disable=too-few-public-methods
+    """Drain a subprocess pipe in a thread into a shared bounded buffer."""
+
+    def __init__(self, pipe, name, lines, stream=None):
+        self.pipe = pipe
+        self.name = name
+        self.lines = lines
+        self.stream = stream
+        self.thread = threading.Thread(target=self._read)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def _read(self):
+        for raw in iter(self.pipe.readline, b''):
+            entry = (
+                time.time(), self.name, raw.decode('utf-8',
+                                                   'replace').rstrip('\n')
+            )
+            self.lines.append(entry)
+            if self.stream:
+                print(_format_output_line(entry), file=self.stream)
+                self.stream.flush()
+        self.pipe.close()
+
+    def join(self, timeout=None):
+        """
+        Wait for the pipe to be read until the end.
+
+        :param timeout: Maximum time to wait.
+        :type timeout: float
+        :return:
+        """
+        self.thread.join(timeout)
 
 
 class DashSubprocess(BaseDashRunner):
     """Runs a dash application in a waitress-serve subprocess."""
 
-    def __init__(self, driver, keep_open=False):
-        super(DashSubprocess, self).__init__(driver, keep_open=keep_open)
+    def __init__(
+            self,
+            driver,
+            keep_open=False,
+            port_range=None,
+            stream_output=False,
+            max_output_lines=1000,
+            record_requests=False
+    ):
+        """
+        :param driver: Selenium driver
+        :type driver: selenium.webdriver.remote.webdriver.WebDriver
+        :param keep_open: Keep the server open
+        :type keep_open: bool
+        :param port_range: Inclusive (start, end) ports for ``port='auto'``.
+        :type port_range: tuple
+        :param stream_output: Print the server output as it comes to stderr.
+        :type stream_output: bool
+        :param max_output_lines: Number of output lines to keep.
+        :type max_output_lines: int
+        :param record_requests: Record the requests of the server in
+            ``recorded_requests``, the app is served with an instrumented
+            factory.
+        :type record_requests: bool
+        """
+        super(DashSubprocess, self).__init__(
+            driver,
+            keep_open=keep_open,
+            port_range=port_range,
+            record_requests=record_requests
+        )
         self.process = None
+        self.stream_output = stream_output
+        self.output = collections.deque(maxlen=max_output_lines)
+        self._readers = []
 
     # pylint: disable=arguments-differ
     def start(self, app_module, application_name='app', port=8050):
@@ -203,29 +589,48 @@ class DashSubprocess(BaseDashRunner):
         :type app_module: str
         :param application_name: Variable name of the dash instance.
         :type application_name: str
-        :param port: Port to serve the application.
-        :type port: int
+        :param port: Port to serve the application, ``'auto'`` to use a
+            free port.
+        :type port: int|str
         :return:
         """
         server_path = '{}:{}.server'.format(app_module, application_name)
-        self.port = port
+        self.port = self._resolve_port(port)
 
         is_windows = sys.platform == 'win32'
+        env = None
+
+        if self.recorded_requests is not None:
+            # The factory wraps the app and writes the records to a file.
+            fd, self.recorded_requests.path = tempfile.mkstemp(
+                prefix='pytest-dash-requests-', suffix='.jsonl'
+            )
+            os.close(fd)
+            env = dict(os.environ)
+            env[_app_env] = '{}:{}'.format(app_module, application_name)
+            env[_log_env] = self.recorded_requests.path
+            server_path = \
+                '--call pytest_dash.instrumentation:create_recorded_app'
 
         cmd = 'waitress-serve --listen=127.0.0.1:{} {}'.format(
-            port, server_path
+            self.port, server_path
         )
         line = shlex.split(cmd, posix=not is_windows)
 
         # noinspection PyTypeChecker
         self.process = subprocess.Popen(
-            line, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            line, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env
         )
-
-        url = 'http://localhost:{}/'.format(port)
+        stream = sys.stderr if self.stream_output else None
+        self._readers = [
+            _OutputReader(self.process.stdout, 'stdout', self.output, stream),
+            _OutputReader(self.process.stderr, 'stderr', self.output, stream),
+        ]
 
         try:
-            _wait_for_client_app_started(self.driver, url)
+            _wait_for_client_app_started(
+                self.driver, self.url, check_alive=self._check_alive
+            )
         except errors.DashAppLoadingError:
             status = self.process.poll()
             print(
@@ -233,17 +638,165 @@ class DashSubprocess(BaseDashRunner):
                     cmd, status
                 )
             )
+            if not self.stream_output:
+                print(self.get_output())
             self.started = status is None
             raise
         else:
             self.started = True
 
+    def _check_alive(self):
+        # Fail the server probe at once if the app crashed (eg: on import).
+        status = self.process.poll()
+        if status is None:
+            return
+        for reader in self._readers:
+            reader.join(1)
+        raise errors.DashAppLoadingError(
+            'Dash subprocess exited with status {}:\n{}'.format(
+                status, self.get_output()
+            )
+        )
+
     def stop(self):
         self.process.kill()
-        while not self.process.poll():
-            time.sleep(0.01)
-        out, err = self.process.communicate()
-        if out:
-            print(out.decode(), file=sys.stderr)  # pragma: no cover
-        if err:
-            print(err.decode(), file=sys.stderr)
+        if not _wait_for_process(self.process, self.stop_timeout):
+            raise errors.ServerCloseError(  # pragma: no cover
+                'Dash subprocess did not exit (pid={})'.format(
+                    self.process.pid
+                )
+            )
+        for reader in self._readers:
+            reader.join(1)
+        if self.recorded_requests is not None and \
+                self.recorded_requests.path:
+            # Load the last records and remove the file.
+            self.recorded_requests.close()
+
+    def get_output(self, since=None):
+        """
+        The output of the server process with timestamps.
+
+        :param since: Only the lines logged after this timestamp.
+        :type since: float
+        :return: The formatted output lines.
+        :rtype: str
+        """
+        return '\n'.join(
+            _format_output_line(x) for x in list(self.output)
+            if since is None or x[0] >= since
+        )
+
+    def report_sections(self, since=None):
+        sections = super(DashSubprocess, self).report_sections(since)
+        output = self.get_output(since)
+        if output:
+            sections.append(('Captured dash subprocess output', output))
+        return sections
+
+
+class DashSubprocessPool(object):
+    """
+    Keep waitress-serve subprocesses alive to reuse them between tests.
+
+    Servers are started the first time an application is requested and
+    are reused for the same ``(app_module, application_name)`` until
+    :py:meth:`stop` is called. A server is restarted if the application is
+    requested on another port, the pooled server of another application
+    holding the requested port is stopped.
+    """
+
+    def __init__(
+            self, port_range=None, stream_output=False, record_requests=False
+    ):
+        """
+        :param port_range: Inclusive (start, end) ports for the servers.
+        :type port_range: tuple
+        :param stream_output: Print the servers output as it comes.
+        :type stream_output: bool
+        :param record_requests: Record the requests of the servers.
+        :type record_requests: bool
+        """
+        self.port_range = port_range
+        self.stream_output = stream_output
+        self.record_requests = record_requests
+        self.servers = {}
+
+    def start(self, driver, app_module, application_name='app', port='auto'):
+        """
+        Get a running server for the application and load it in the driver.
+
+        :param driver: Selenium driver
+        :type driver: selenium.webdriver.remote.webdriver.WebDriver
+        :param app_module: Dot notation path to the app file.
+        :type app_module: str
+        :param application_name: Variable name of the dash instance.
+        :type application_name: str
+        :param port: Port to serve the application, ``'auto'`` to reuse
+            the server on any port or start it on a free port.
+        :type port: int|str
+        :raise: pytest_dash.errors.PortAllocationError
+        :return: The running server.
+        :rtype: DashSubprocess
+        """
+        key = (app_module, application_name)
+        requested_port = None if port == 'auto' else int(port)
+        server = self.servers.get(key)
+
+        if server is not None:
+            if server.process.poll() is None and \
+                    requested_port in (None, server.port):
+                server.driver = driver
+                server.reload()
+                return server
+            # The server died or the port changed, start a new one.
+            self._stop_server(key)
+
+        if requested_port is not None:
+            for other_key, other in list(self.servers.items()):
+                if other.port == requested_port:
+                    self._stop_server(other_key)
+            # The probe would reach the app of another server on the port.
+            if not _can_bind('127.0.0.1', requested_port, True):
+                raise errors.PortAllocationError(
+                    'Port {} is already in use, could not start {}'.format(
+                        requested_port, app_module
+                    )
+                )
+
+        server = DashSubprocess(
+            driver,
+            keep_open=True,
+            port_range=self.port_range,
+            stream_output=self.stream_output,
+            record_requests=self.record_requests
+        )
+        try:
+            server.start(
+                app_module, application_name=application_name, port=port
+            )
+        except Exception:  # pylint: disable=broad-except
+            exc_info = sys.exc_info()
+            if server.process is not None:
+                # Kill the process and join its output readers.
+                server.stop()
+            six.reraise(*exc_info)
+
+        self.servers[key] = server
+        return server
+
+    def _stop_server(self, key):
+        server = self.servers.pop(key)
+        server.stop()
+        _wait_for_server_closed(server.url, server.stop_timeout)
+
+    def stop(self):
+        """
+        Stop all the servers of the pool.
+
+        :return:
+        """
+        servers = list(self.servers.values())
+        self.servers.clear()
+        for server in servers:
+            server.stop()
@@ -3,12 +3,15 @@ import functools
 import six
 
 import lark
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
 
+from pytest_dash.conditions import _normalize_style
 from pytest_dash.wait_for import (
-    wait_for_element_by_id, wait_for_element_by_css_selector,
-    wait_for_elements_by_css_selector, wait_for_element_by_xpath,
-    wait_for_elements_by_xpath
+    _wait_for, _element_condition, wait_for_element_by_id,
+    wait_for_element_by_css_selector, wait_for_elements_by_css_selector,
+    wait_for_element_by_xpath, wait_for_elements_by_xpath,
+    wait_for_callbacks_idle
 )
 
 _grammar = r'''
@@ -67,6 +70,7 @@ compare: value comparison value
 ?command: "clear" elemental -> clear
     | "click" elemental -> click
     | "enter" value "in" element -> send_value
+    | "wait for callbacks"i -> wait_for_callbacks
     %(commands)%
 
 %import common.CNAME -> NAME
@@ -91,6 +95,39 @@ def _compare(left, comparison, right):
     return False
 
 
+class _CachedElement(WebElement):
+    """
+    Element kept in the behavior elements cache, the element is found again
+    with its locator when it's stale and the command is retried.
+    """
+
+    def __init__(self, element, find, locator=None):
+        kwargs = {}
+        if hasattr(element, '_w3c'):
+            # Selenium 4 removed the w3c argument.
+            kwargs['w3c'] = getattr(element, '_w3c')
+        super(_CachedElement,
+              self).__init__(element.parent, element.id, **kwargs)
+        self._find = find
+        # `(by, selector)` of the element, for the waits records.
+        self.locator = locator
+
+    def refresh(self):
+        """
+        Find the element again from its locator.
+
+        :return:
+        """
+        self._id = self._find().id
+
+    def _execute(self, command, params=None):
+        try:
+            return super(_CachedElement, self)._execute(command, params)
+        except StaleElementReferenceException:
+            self.refresh()
+            return super(_CachedElement, self)._execute(command, params)
+
+
 class BehaviorTransformerMeta(type):
     """
     Dynamically create a parser transformer with user defined behaviors
@@ -105,18 +142,24 @@ class BehaviorTransformerMeta(type):
         comparisons = []
         commands = []
 
-        def wrapper(fun, inline, meta, tree):
+        def wrapper(fun, inline, meta, tree, command):
             @functools.wraps(fun)
             @lark.v_args(inline=inline, meta=meta, tree=tree)
             # pylint: disable=unused-argument
             def _wrap(self, *args, **kwargs):
-                return fun(*args, **kwargs)
+                try:
+                    return fun(*args, **kwargs)
+                finally:
+                    if command:
+                        # Custom commands may change the page.
+                        self.clear_elements()
 
             return _wrap
 
         for key, behavior in behaviors.items():
             new_attrs[key] = wrapper(
-                behavior.handler, behavior.inline, behavior.meta, behavior.tree
+                behavior.handler, behavior.inline, behavior.meta,
+                behavior.tree, behavior.kind == 'command'
             )
             if behavior.kind == 'comparison':
                 # Custom comparisons need to be assigned the transformer
@@ -162,6 +205,24 @@ class BehaviorTransformer(lark.Transformer, object):
         """
         self.driver = driver
         self.variables = variables or {}
+        self._elements = {}
+
+    def _cached_element(self, find, *locator):
+        # Elements are found once per behavior until a command is run.
+        element = self._elements.get(locator)
+        if element is None:
+            element = _CachedElement(find(), find, locator)
+            self._elements[locator] = element
+        return element
+
+    def clear_elements(self):
+        """
+        Clear the elements cache, the commands call it after they run
+        as they may change the page.
+
+        :return:
+        """
+        self._elements.clear()
 
     def variable(self, name):
         """
@@ -200,7 +261,11 @@ class BehaviorTransformer(lark.Transformer, object):
         :kind: value
         :param element_id: Text after `#`
         """
-        return wait_for_element_by_id(self.driver, element_id.replace('#', ''))
+        element_id = element_id.replace('#', '')
+        return self._cached_element(
+            functools.partial(wait_for_element_by_id, self.driver, element_id),
+            'id', element_id
+        )
 
     def element_selector(self, selector):
         """
@@ -211,9 +276,11 @@ class BehaviorTransformer(lark.Transformer, object):
         :kind: value
         :param selector: Text contained between `{` & `}`
         """
-        return wait_for_element_by_css_selector(
-            self.driver,
-            selector.lstrip('{').rstrip('}')
+        selector = selector.lstrip('{').rstrip('}')
+        return self._cached_element(
+            functools.partial(
+                wait_for_element_by_css_selector, self.driver, selector
+            ), 'css', selector
         )
 
     def elements_selector(self, selector):
@@ -246,7 +313,11 @@ class BehaviorTransformer(lark.Transformer, object):
         :Example: ``[//div/span]``
         :kind: value
         """
-        return wait_for_element_by_xpath(self.driver, xpath[1:-1])
+        xpath = xpath[1:-1]
+        return self._cached_element(
+            functools.partial(wait_for_element_by_xpath, self.driver, xpath),
+            'xpath', xpath
+        )
 
     def elements_xpath(self, xpath):
         """
@@ -268,6 +339,7 @@ class BehaviorTransformer(lark.Transformer, object):
         :kind: command
         """
         element.clear()
+        self.clear_elements()
 
     def click(self, element):
         """
@@ -281,6 +353,7 @@ class BehaviorTransformer(lark.Transformer, object):
                 elem.click()
         else:
             element.click()
+        self.clear_elements()
 
     def send_value(self, value, element):
         """
@@ -290,6 +363,17 @@ class BehaviorTransformer(lark.Transformer, object):
         :kind: command
         """
         element.send_keys(value)
+        self.clear_elements()
+
+    def wait_for_callbacks(self):
+        """
+        Wait until dash has no pending callback.
+
+        :Example: ``wait for callbacks``
+        :kind: command
+        """
+        wait_for_callbacks_idle(self.driver)
+        self.clear_elements()
 
     def escape_string(self, escaped):
         """
@@ -309,10 +393,10 @@ class BehaviorTransformer(lark.Transformer, object):
 
         # We have the element and not the selector so we cannot use the
         # wait_for_text wrapper.
-        def _text_equal(_):
-            return element.text == str(value)
-
-        WebDriverWait(self.driver, 10).until(_text_equal)
+        _wait_for(
+            self.driver,
+            _element_condition(element, 'text', lambda x: x == str(value))
+        )
 
     def prop_compare(self, element, prop, comparison, value):
         """
@@ -322,11 +406,15 @@ class BehaviorTransformer(lark.Transformer, object):
         :kind: comparison
         """
 
-        def _prop_compare(_):
-            prop_value = element.get_property(prop)
-            return _compare(prop_value, comparison, value)
-
-        WebDriverWait(self.driver, 10).until(_prop_compare)
+        _wait_for(
+            self.driver,
+            _element_condition(
+                element,
+                'prop',
+                lambda x: _compare(x, comparison, value),
+                name=prop
+            )
+        )
 
     def style_compare(self, style, element, _, value):
         """
@@ -344,11 +432,15 @@ class BehaviorTransformer(lark.Transformer, object):
         :return:
         """
 
-        def _style_compare(_):
-            style_value = element.value_of_css_property(style)
-            return style_value == value
-
-        WebDriverWait(self.driver, 10).until(_style_compare)
+        _wait_for(
+            self.driver,
+            _element_condition(
+                element,
+                'style',
+                lambda x: x == _normalize_style(value),
+                name=style
+            )
+        )
 
     def true_value(self):
         return True
@@ -7,6 +7,7 @@ from ruamel import yaml
 from pytest_dash import errors
 from pytest_dash.application_runners import DashSubprocess
 from pytest_dash.behavior_parser import parser_factory
+from pytest_dash.drivers import drain_console_logs
 
 
 class DashBehaviorTestFile(pytest.File):
@@ -57,15 +58,23 @@ class DashBehaviorTestItem(pytest.Item):
         super(DashBehaviorTestItem, self).__init__(name, parent)
         self._application = application or {}
         self.plugin = plugin
-        self.driver = plugin.driver
+        self.driver = None
         self.spec = spec
         self.parameters = kwargs
+        self.runner = None
+        # Time budget of the behavior, set by the plugin before it runs.
+        self.time_budget = spec.get('timeout')
 
     # pylint: disable=missing-docstring
     def runtest(self):
+        with self.plugin.driver_pool.driver() as driver:
+            self.driver = driver
+            self._run_behavior()
+
+    def _run_behavior(self):
         application = self.spec.get('application', self._application)
         app_path = application.get('path')
-        app_port = application.get('port', 8050)
+        app_port = application.get('port', 'auto')
         app_name = application.get('application_name', 'app')
         events = self.spec.get('event')
         outcomes = self.spec.get('outcome', [])
@@ -76,10 +85,29 @@ class DashBehaviorTestItem(pytest.Item):
         }
         parser = parser_factory(self.driver, variables, self.plugin.behaviors)
 
-        with DashSubprocess(self.driver) as starter:
+        commands = itertools.chain(events, outcomes)
+
+        if application.get('reuse', True):
+            self.runner = self.plugin.server_pool.start(
+                self.driver,
+                app_path,
+                application_name=app_name,
+                port=app_port
+            )
+            self._run_commands(parser, commands)
+            return
+
+        self.runner = DashSubprocess(
+            self.driver, **self.plugin.settings['subprocess']
+        )
+        with self.runner as starter:
             starter(app_path, port=app_port, application_name=app_name)
-            for command in itertools.chain(events, outcomes):
-                parser.parse(command)
+            self._run_commands(parser, commands)
+
+    def _run_commands(self, parser, commands):
+        for command in commands:
+            parser.parse(command)
+            drain_console_logs(self.driver)
 
     # pylint: disable=missing-docstring
     def reportinfo(self):
@@ -0,0 +1,189 @@
+"""
+Conditions on the elements for the batched waits, evaluated together in the
+browser by :py:func:`~.wait_for.wait_for_all` and
+:py:func:`~.wait_for.wait_for_any`.
+"""
+import re
+
+import six
+
+_rgb_regex = re.compile(r'^rgb\((\d+),\s*(\d+),\s*(\d+)\)$')
+
+
+def _normalize_style(value):
+    # The drivers return the colors as `rgba`, the computed style as `rgb`.
+    if not isinstance(value, six.string_types):
+        return value
+    value = value.strip()
+    match = _rgb_regex.match(value)
+    if match:
+        return 'rgba({}, {}, {}, 1)'.format(*match.groups())
+    return value
+
+
+class Condition(object):
+    """
+    A condition on an element evaluated in the browser by
+    :py:func:`~.wait_for.wait_for_all` and :py:func:`~.wait_for.wait_for_any`.
+
+    Use the builders :py:func:`element_present`, :py:func:`text_to_equal`,
+    :py:func:`property_to_equal` and :py:func:`style_to_equal`.
+    """
+
+    def __init__(
+            self,
+            kind,
+            selector,
+            name=None,
+            expected=None,
+            by='css',
+            multiple=False
+    ):
+        """
+        :param kind: ``selector``, ``text``, ``prop`` or ``style``.
+        :type kind: str
+        :param selector: Selector of the element.
+        :type selector: str
+        :param name: Name of the property or style attribute.
+        :type name: str
+        :param expected: Value to equal.
+        :param by: Type of selector: ``css``, ``xpath`` or ``id``.
+        :type by: str
+        :param multiple: Find all the elements of a ``selector`` condition.
+        :type multiple: bool
+        """
+        self.kind = kind
+        self.selector = selector
+        self.name = name
+        self.expected = expected
+        self.by = by
+        self.multiple = multiple
+        self.value = None
+
+    @property
+    def spec(self):
+        """
+        :return: The condition as sent to the browser script.
+        :rtype: dict
+        """
+        return {
+            'kind': self.kind,
+            'by': self.by,
+            'selector': self.selector,
+            'name': self.name,
+            'multiple': self.multiple,
+        }
+
+    def check(self, result):
+        """
+        :param result: ``{found, value}`` from the browser.
+        :type result: dict
+        :return: True if the condition holds.
+        :rtype: bool
+        """
+        self.value = result.get('value')
+        if not result.get('found'):
+            return False
+        if self.kind == 'selector':
+            return True
+        if self.kind == 'style':
+            return _normalize_style(self.expected) == \
+                _normalize_style(self.value)
+        return self.expected == self.value
+
+    @property
+    def description(self):
+        """
+        :return: Readable description of the condition for the errors and
+            the wait records.
+        :rtype: str
+        """
+        if self.kind == 'selector':
+            return '{} {}'.format(
+                'elements' if self.multiple else 'element', self.selector
+            )
+        target = {
+            'text': 'text',
+            'prop': 'property {}'.format(self.name),
+            'style': 'style {}'.format(self.name),
+        }[self.kind]
+        return '{} of {} to equal {!r}'.format(
+            target, self.selector, self.expected
+        )
+
+    def __str__(self):
+        if self.kind == 'selector':
+            return self.description
+        return '{} (last value: {!r})'.format(self.description, self.value)
+
+
+def element_present(selector, by='css'):
+    """
+    Condition for an element to be found, the value is the element.
+
+    :param selector: Selector of the element.
+    :type selector: str
+    :param by: Type of selector: ``css``, ``xpath`` or ``id``.
+    :type by: str
+    :rtype: Condition
+    """
+    return Condition('selector', selector, by=by)
+
+
+def elements_present(selector, by='css'):
+    """
+    Condition for at least one element to be found, the value is the list
+    of elements.
+
+    :param selector: Selector of the elements.
+    :type selector: str
+    :param by: Type of selector: ``css`` or ``xpath``.
+    :type by: str
+    :rtype: Condition
+    """
+    return Condition('selector', selector, by=by, multiple=True)
+
+
+def text_to_equal(selector, text):
+    """
+    Condition for the text of an element to equal.
+
+    :param selector: CSS selector of the element.
+    :type selector: str
+    :param text: Text to equal.
+    :type text: str
+    :rtype: Condition
+    """
+    return Condition('text', selector, expected=text)
+
+
+def property_to_equal(selector, prop_name, prop_value):
+    """
+    Condition for a property of an element to equal.
+
+    :param selector: CSS selector of the element.
+    :type selector: str
+    :param prop_name: Name of the property.
+    :type prop_name: str
+    :param prop_value: Value to equal.
+    :rtype: Condition
+    """
+    return Condition('prop', selector, name=prop_name, expected=prop_value)
+
+
+def style_to_equal(selector, style_attribute, style_assertion):
+    """
+    Condition for a computed style attribute of an element to equal,
+    ``rgb`` colors are compared as ``rgba``.
+
+    :param selector: CSS selector of the element.
+    :type selector: str
+    :param style_attribute: Name of the CSS attribute.
+    :type style_attribute: str
+    :param style_assertion: Value to equal.
+    :type style_assertion: str
+    :rtype: Condition
+    """
+    return Condition(
+        'style', selector, name=style_attribute, expected=style_assertion
+    )
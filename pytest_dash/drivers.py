@@ -0,0 +1,568 @@
+"""Selenium drivers management for the plugin."""
+import collections
+import contextlib
+import importlib
+import sys
+import tempfile
+import threading
+import time
+import warnings
+import weakref
+
+import six
+from six.moves import queue
+
+from pytest_dash.errors import DriverPoolTimeoutError
+
+_reset_script = '''
+try { window.stop(); } catch (e) {}
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+try {
+    document.cookie.split(';').forEach(function (cookie) {
+        var name = cookie.split('=')[0].trim();
+        if (name) {
+            document.cookie = name +
+                '=; expires=Thu, 01 Jan 1970 00:00:00 GMT; path=/';
+        }
+    });
+} catch (e) {}
+'''
+
+
+def _chrome_options(
+        options, headless, window_size, disable_images, disable_extensions,
+        profile
+):
+    if headless:
+        options.add_argument('--headless')
+        options.add_argument('--disable-gpu')
+    if window_size:
+        options.add_argument('--window-size={},{}'.format(*window_size))
+    if disable_images:
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option(
+            'prefs', {'profile.managed_default_content_settings.images': 2}
+        )
+    if disable_extensions:
+        options.add_argument('--disable-extensions')
+    if profile:
+        options.add_argument('--user-data-dir={}'.format(profile))
+
+
+def _firefox_options(
+        options, headless, window_size, disable_images, disable_extensions,
+        profile
+):
+    if headless:
+        options.add_argument('-headless')
+    if window_size:
+        options.add_argument('--width={}'.format(window_size[0]))
+        options.add_argument('--height={}'.format(window_size[1]))
+    if disable_images:
+        options.set_preference('permissions.default.image', 2)
+    if disable_extensions:
+        options.set_preference('extensions.enabledScopes', 0)
+        options.set_preference('extensions.autoDisableScopes', 15)
+    if profile:
+        options.add_argument('-profile')
+        options.add_argument(profile)
+
+
+# Drivers configured with an options object: module of the options class
+# and function applying the browser options.
+_driver_options = {
+    'Chrome': ('selenium.webdriver.chrome.options', _chrome_options),
+    'Opera': ('selenium.webdriver.opera.options', _chrome_options),
+    'Firefox': ('selenium.webdriver.firefox.options', _firefox_options),
+}
+
+# Other drivers only get the desired capabilities: keyword argument and
+# default capabilities, the window is resized once the driver is created.
+_driver_capabilities = {
+    'Edge': ('capabilities', 'EDGE'),
+    'Ie': ('desired_capabilities', 'INTERNETEXPLORER'),
+    'Safari': ('desired_capabilities', 'SAFARI'),
+    'PhantomJS': ('desired_capabilities', 'PHANTOMJS'),
+    'Remote': ('desired_capabilities', None),
+}
+
+
+def browser_options(
+        driver_name,
+        headless=False,
+        window_size=None,
+        page_load_strategy=None,
+        disable_images=False,
+        disable_extensions=False,
+        profile_dir=None
+):
+    """
+    Create the keyword arguments of a driver with the performance options.
+
+    The Chrome, Opera and Firefox drivers get an options object with all
+    the options. The other drivers get the page load strategy in their
+    desired capabilities and a warning for the options they can't honor,
+    the window size is set by the plugin after they are created.
+
+    :param driver_name: Name of the selenium driver.
+    :type driver_name: str
+    :param headless: Run the browser without a window.
+    :type headless: bool
+    :param window_size: Width and height of the browser window.
+    :type window_size: tuple
+    :param page_load_strategy: ``normal``, ``eager`` (don't wait for the
+        images and stylesheets) or ``none``.
+    :type page_load_strategy: str
+    :param disable_images: Don't load the images.
+    :type disable_images: bool
+    :param disable_extensions: Disable the browser extensions.
+    :type disable_extensions: bool
+    :param profile_dir: Create the browser profile in a temporary directory
+        inside this directory (eg: a tmpfs mount like ``/dev/shm``).
+    :type profile_dir: str
+    :return: Keyword arguments for the driver and the created profile
+        directory.
+    :rtype: tuple
+    """
+    if driver_name in _driver_options:
+        module_name, apply_options = _driver_options[driver_name]
+        options = importlib.import_module(module_name).Options()
+        profile = tempfile.mkdtemp(
+            prefix='pytest-dash-', dir=profile_dir
+        ) if profile_dir else None
+        apply_options(
+            options, headless, window_size, disable_images, disable_extensions,
+            profile
+        )
+        if page_load_strategy:
+            options.set_capability('pageLoadStrategy', page_load_strategy)
+        return {'options': options}, profile
+
+    unsupported = [
+        name for name, value in (
+            ('headless', headless and driver_name != 'PhantomJS'),
+            ('disable_images', disable_images),
+            ('disable_extensions', disable_extensions),
+            ('profile_dir', profile_dir),
+        ) if value
+    ]
+    if unsupported:
+        warnings.warn(
+            'The {} driver ignores the browser options: {}'.format(
+                driver_name, ', '.join(unsupported)
+            )
+        )
+    if not page_load_strategy or driver_name not in _driver_capabilities:
+        return {}, None
+    return _desired_capabilities(driver_name, page_load_strategy), None
+
+
+def _desired_capabilities(driver_name, page_load_strategy):
+    from selenium.webdriver import DesiredCapabilities
+    keyword, default = _driver_capabilities[driver_name]
+    capabilities = dict(
+        getattr(DesiredCapabilities, default) if default else {}
+    )
+    capabilities['pageLoadStrategy'] = page_load_strategy
+    return {keyword: capabilities}
+
+
+class ConsoleLogCollector(object):
+    """
+    Bounded buffer of the browser console logs of a driver.
+
+    The selenium browser logs are cleared when read, the collector drains
+    them at most once per ``interval`` unless forced, so the logs emitted
+    during the callbacks are kept without reading them on every poll.
+    """
+
+    def __init__(self, max_entries=1000, interval=0.25):
+        """
+        :param max_entries: Maximum number of entries to keep, the oldest
+            are dropped first.
+        :type max_entries: int
+        :param interval: Minimum time between two reads of the logs.
+        :type interval: float
+        """
+        self.interval = interval
+        self.supported = True
+        self._entries = collections.deque(maxlen=max_entries)
+        self._last_read = 0
+        self._lock = threading.Lock()
+
+    def drain(self, driver, force=False):
+        """
+        Read the new browser logs of the driver into the buffer.
+
+        :param driver: Selenium driver
+        :type driver: selenium.webdriver.remote.webdriver.WebDriver
+        :param force: Read even if the last read is more recent than
+            the interval.
+        :type force: bool
+        :return:
+        """
+        now = time.time()
+        with self._lock:
+            if not self.supported or \
+                    (not force and now - self._last_read < self.interval):
+                return
+            self._last_read = now
+            from selenium.common.exceptions import WebDriverException
+            try:
+                logs = driver.get_log('browser')
+            except WebDriverException:
+                # Firefox and others don't support the logs endpoint.
+                self.supported = False
+                return
+            for entry in logs:
+                self._entries.append((now, entry))
+
+    def entries(self, since=None):
+        """
+        :param since: Only the entries read after this time.
+        :type since: float
+        :return: The log entries as returned by selenium.
+        :rtype: list
+        """
+        with self._lock:
+            return [
+                entry for read_time, entry in self._entries
+                if since is None or read_time >= since
+            ]
+
+    def severe(self, since=None):
+        """
+        :param since: Only the entries read after this time.
+        :type since: float
+        :return: The ``SEVERE`` log entries.
+        :rtype: list
+        """
+        return [x for x in self.entries(since) if x.get('level') == 'SEVERE']
+
+    def clear(self):
+        """Discard the buffered entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+def format_console_entries(entries):
+    """
+    :param entries: Browser log entries.
+    :type entries: list
+    :return: One ``[LEVEL] message`` line per entry.
+    :rtype: str
+    """
+    return '\n'.join(
+        '[{}] {}'.format(x.get('level'), x.get('message')) for x in entries
+    )
+
+
+_console_collectors = weakref.WeakKeyDictionary()
+
+
+def attach_console_logs(driver, collector):
+    """
+    Collect the console logs of a driver after the waits and behavior steps.
+
+    :param driver: Selenium driver
+    :type driver: selenium.webdriver.remote.webdriver.WebDriver
+    :param collector: The buffer to drain the logs into.
+    :type collector: ConsoleLogCollector
+    :return:
+    """
+    _console_collectors[driver] = collector
+
+
+def get_console_logs(driver):
+    """
+    :param driver: Selenium driver
+    :type driver: selenium.webdriver.remote.webdriver.WebDriver
+    :return: The collector attached to the driver, None if there is none.
+    :rtype: ConsoleLogCollector
+    """
+    return _console_collectors.get(driver)
+
+
+def drain_console_logs(driver, force=False):
+    """
+    Drain the console logs of the driver if a collector is attached.
+
+    :param driver: Selenium driver
+    :type driver: selenium.webdriver.remote.webdriver.WebDriver
+    :param force: Read even if the last read is more recent than
+        the collector interval.
+    :type force: bool
+    :return: The collector attached to the driver, None if there is none.
+    :rtype: ConsoleLogCollector
+    """
+    collector = _console_collectors.get(driver)
+    if collector is not None:
+        collector.drain(driver, force=force)
+    return collector
+
+
+def reset_browser(driver):
+    """
+    Clear the browser state left by a test without restarting it.
+
+    Pending requests are cancelled and the storages cleared in a single
+    script, then the cookies are deleted and the driver navigates to
+    ``about:blank`` to drop the in memory state (eg: ``dcc.Store``).
+
+    :param driver: Selenium driver
+    :type driver: selenium.webdriver.remote.webdriver.WebDriver
+    :return:
+    """
+    driver.execute_script(_reset_script)
+    driver.delete_all_cookies()
+    driver.get('about:blank')
+
+
+def _quit_driver(driver):
+    try:
+        driver.quit()
+    except Exception:  # pylint: disable=broad-except
+        pass
+
+
+class _PrewarmError(object):  # pylint: disable=too-few-public-methods
+    # Error of a pre-warmed driver factory, raised on acquire.
+    def __init__(self, exc_info):
+        self.exc_info = exc_info
+
+
+class DriverPool(object):
+    """
+    Pool of selenium drivers with checkout/return semantics.
+
+    Drivers are created lazily up to ``size``, then ``acquire`` blocks until
+    a driver is returned to the pool. A thread acquiring again gets the
+    driver it already holds, so nested fixtures share the same browser.
+    """
+
+    def __init__(self, factory, size=1):
+        """
+        :param factory: Function creating a new driver.
+        :param size: Maximum number of drivers.
+        :type size: int
+        """
+        self.factory = factory
+        self.size = size
+        self.drivers = []
+        self._available = queue.Queue()
+        # Notified when a driver creation ends.
+        self._lock = threading.Condition()
+        self._reserved = 0
+        # Thread ident: [driver, hold count, replaced drivers].
+        self._held = {}
+
+    def acquire(self, timeout=60):
+        """
+        Checkout a driver from the pool.
+
+        :param timeout: Maximum time to wait for a driver to be available,
+            None to wait forever.
+        :type timeout: float
+        :raise: pytest_dash.errors.DriverPoolTimeoutError
+        :return: A selenium driver.
+        :rtype: selenium.webdriver.remote.webdriver.WebDriver
+        """
+        ident = threading.current_thread().ident
+        with self._lock:
+            held = self._held.get(ident)
+            if held:
+                held[1] += 1
+                return held[0]
+            create = self._available.empty() and self._reserved < self.size
+            if create:
+                self._reserved += 1
+
+        if create:
+            try:
+                driver = self.factory()
+            except Exception:
+                with self._lock:
+                    self._reserved -= 1
+                    self._lock.notify_all()
+                raise
+            with self._lock:
+                self.drivers.append(driver)
+                self._lock.notify_all()
+        else:
+            try:
+                driver = self._available.get(timeout=timeout)
+            except queue.Empty:
+                raise DriverPoolTimeoutError(
+                    'No driver available after {}s (pool size={})'.format(
+                        timeout, self.size
+                    )
+                )
+            if isinstance(driver, _PrewarmError):
+                # pylint: disable=raising-bad-type
+                six.reraise(*driver.exc_info)
+
+        with self._lock:
+            self._held[ident] = [driver, 1, []]
+        return driver
+
+    def current(self):
+        """
+        :return: The driver held by the current thread, None if it holds
+            none.
+        :rtype: selenium.webdriver.remote.webdriver.WebDriver
+        """
+        with self._lock:
+            held = self._held.get(threading.current_thread().ident)
+        return held[0] if held else None
+
+    def prewarm(self, count=1):
+        """
+        Create drivers in background threads, an ``acquire`` waiting for a
+        pre-warmed driver gets it as soon as it's ready. The errors of the
+        factory are raised by the ``acquire`` getting the driver.
+
+        :param count: Number of drivers to create, capped to the free
+            slots of the pool.
+        :type count: int
+        :return: The started threads.
+        :rtype: list
+        """
+        threads = []
+        with self._lock:
+            count = min(count, self.size - self._reserved)
+            self._reserved += max(count, 0)
+
+        for _ in range(count):
+            thread = threading.Thread(target=self._prewarm_driver)
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+        return threads
+
+    def _prewarm_driver(self):
+        try:
+            driver = self.factory()
+        except Exception:  # pylint: disable=broad-except
+            with self._lock:
+                self._reserved -= 1
+                self._lock.notify_all()
+            self._available.put(_PrewarmError(sys.exc_info()))
+            return
+        with self._lock:
+            self.drivers.append(driver)
+            self._lock.notify_all()
+        self._available.put(driver)
+
+    def release(self, driver):
+        """
+        Return a driver to the pool.
+
+        :param driver: A driver from :py:meth:`acquire`, a replaced driver
+            releases its replacement.
+        :return:
+        """
+        with self._lock:
+            for ident, held in list(self._held.items()):
+                if held[0] is driver or any(x is driver for x in held[2]):
+                    driver = held[0]
+                    held[1] -= 1
+                    if held[1] > 0:
+                        return
+                    del self._held[ident]
+                    break
+            if not any(x is driver for x in self.drivers):
+                # Discarded while it was held.
+                return
+        self._available.put(driver)
+
+    def discard(self, driver):
+        """
+        Quit a broken driver and remove it from the pool, a new driver is
+        created the next time one is needed.
+
+        :param driver: A driver from :py:meth:`acquire`.
+        :return:
+        """
+        with self._lock:
+            removed, _ = self._remove(driver)
+            if removed:
+                self._reserved -= 1
+        if removed:
+            _quit_driver(driver)
+
+    def replace(self, driver):
+        """
+        Quit a broken driver, the threads holding it hold a new driver
+        instead and releasing the broken driver releases the new one.
+
+        :param driver: A driver from :py:meth:`acquire`.
+        :return: The new driver, None if no thread held the driver.
+        :rtype: selenium.webdriver.remote.webdriver.WebDriver
+        """
+        with self._lock:
+            removed, held = self._remove(driver)
+            if removed and not held:
+                self._reserved -= 1
+        if removed:
+            _quit_driver(driver)
+        if not held:
+            return None
+
+        # The slot of the broken driver is kept for the new one.
+        try:
+            new_driver = self.factory()
+        except Exception:
+            with self._lock:
+                self._reserved -= 1
+                self._lock.notify_all()
+            raise
+        with self._lock:
+            self.drivers.append(new_driver)
+            for ident, (_, count, replaced) in held.items():
+                self._held[ident] = [new_driver, count, replaced + [driver]]
+            self._lock.notify_all()
+        return new_driver
+
+    def _remove(self, driver):
+        # Remove a driver from the pool and the threads holding it, return
+        # if it was in the pool and the held entries of the threads.
+        held = {ident: x for ident, x in self._held.items() if x[0] is driver}
+        for ident in held:
+            del self._held[ident]
+        removed = any(x is driver for x in self.drivers)
+        self.drivers = [x for x in self.drivers if x is not driver]
+        return removed, held
+
+    @contextlib.contextmanager
+    def driver(self, timeout=60):
+        """
+        Context manager to acquire a driver and release it on exit.
+
+        :param timeout: Maximum time to wait for a driver, None to wait
+            forever.
+        :type timeout: float
+        """
+        driver = self.acquire(timeout=timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def quit(self):
+        """
+        Quit all the drivers created by the pool.
+
+        :return:
+        """
+        with self._lock:
+            # Wait for the drivers being created to quit them too.
+            while self._reserved > len(self.drivers):
+                self._lock.wait()
+            drivers = list(self.drivers)
+            self.drivers = []
+            self._held.clear()
+            self._reserved = 0
+            self._available = queue.Queue()
+        for driver in drivers:
+            driver.quit()
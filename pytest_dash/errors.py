@@ -9,6 +9,14 @@ class InvalidDriverError(PytestDashError):
     """An invalid selenium driver was specified."""
 
 
+class InvalidServerBackendError(PytestDashError):
+    """An invalid server backend was specified."""
+
+
+class DriverPoolTimeoutError(PytestDashError):
+    """No selenium driver was available in the pool before the timeout."""
+
+
 class NoAppFoundError(PytestDashError):
     """No `app` was found in the file."""
 
@@ -23,3 +31,15 @@ class MissingBehaviorError(PytestDashError):
 
 class ServerCloseError(PytestDashError):
     """Pytest-dash had trouble closing a server."""
+
+
+class ServerNotStartedError(PytestDashError):
+    """The dash server of the runner was not started."""
+
+
+class PortAllocationError(PytestDashError):
+    """No free port could be found for a dash server."""
+
+
+class CallbackError(PytestDashError):
+    """A dash callback failed to update."""
@@ -0,0 +1,286 @@
+"""
+Run the callbacks of a dash application without a server or a browser.
+
+The layout and dependencies are fetched from the dash endpoints with the
+flask test client and the callbacks are fired like the dash renderer does.
+"""
+import itertools
+import json
+
+import six
+
+from pytest_dash import errors
+from pytest_dash.application_runners import BaseDashRunner, import_app
+
+
+def _parse_prop_id(prop_id):
+    # `component_id.prop_name` to a (component_id, prop_name) tuple.
+    return tuple(prop_id.rsplit('.', 1))
+
+
+def _parse_dependency(dependency):
+    # Normalize the callback definitions of the different dash versions.
+    output = dependency['output']
+    if isinstance(output, dict):
+        outputs = [(output['id'], output['property'])]
+    else:
+        # Multi outputs are formatted as `..id.prop...id2.prop2..`
+        outputs = [_parse_prop_id(x) for x in output.strip('.').split('...')
+                   ] if output.startswith('..') else [_parse_prop_id(output)]
+
+    return {
+        'output': output,
+        'outputs': outputs,
+        'inputs': [(x['id'], x['property']) for x in dependency['inputs']],
+        'state':
+        [(x['id'], x['property']) for x in dependency.get('state', [])],
+    }
+
+
+def _callback_payload(dependency, get_value):
+    # Body of a `_dash-update-component` request for a parsed dependency,
+    # `get_value(component_id, prop_name)` gives the inputs & state values.
+    def _values(props):
+        return [{
+            'id': _id,
+            'property': prop,
+            'value': get_value(_id, prop)
+        } for _id, prop in props]
+
+    outputs = [{
+        'id': _id,
+        'property': prop
+    } for _id, prop in dependency['outputs']]
+    return {
+        'output': dependency['output'],
+        'outputs': outputs if len(outputs) > 1 else outputs[0],
+        'inputs': _values(dependency['inputs']),
+        'state': _values(dependency['state']),
+        'changedPropIds': ['{}.{}'.format(*x) for x in dependency['inputs']],
+    }
+
+
+def _walk_components(value, found):
+    # Collect the props of the components with an id in a layout tree.
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            _walk_components(item, found)
+    elif isinstance(value, dict) and 'props' in value and 'type' in value:
+        props = value['props'] or {}
+        if 'id' in props:
+            found[props['id']] = dict(props)
+        for prop in six.itervalues(props):
+            _walk_components(prop, found)
+    return found
+
+
+class DashInProcess(BaseDashRunner):
+    """
+    Runs the callbacks of a dash application with the flask test client.
+
+    No server is started and no browser is used, the layout and the
+    dependencies are fetched from the dash endpoints and callbacks are
+    fired like the dash renderer does, following the chained callbacks
+    until no more updates are pending.
+    """
+
+    def __init__(self, keep_open=False, max_callbacks=1000):
+        """
+        :param keep_open: Keep the application open
+        :type keep_open: bool
+        :param max_callbacks: Maximum number of chained callbacks to fire
+            from a single update.
+        :type max_callbacks: int
+        """
+        super(DashInProcess, self).__init__(None, keep_open=keep_open)
+        self.max_callbacks = max_callbacks
+        self.app = None
+        self.client = None
+        self.dependencies = []
+        self.props = {}
+        self.callback_count = 0
+
+    # pylint: disable=arguments-differ
+    def start(self, app, application_name='app'):
+        """
+        Load the application and fire the initial callbacks.
+
+        .. seealso:: :py:func:`~.plugin.dash_in_process`
+
+        :param app: The dash application instance or the dot notation path
+            to the app file.
+        :type app: dash.Dash|str
+        :param application_name: Variable name of the dash instance if
+            ``app`` is a path.
+        :type application_name: str
+        :return: The dash application.
+        :rtype: dash.Dash
+        """
+        if isinstance(app, six.string_types):
+            app = import_app(app, application_name=application_name)
+
+        self.app = app
+        self.client = app.server.test_client()
+        self.started = True
+        self.reload()
+        return app
+
+    def stop(self):
+        self.client = None
+
+    def _shutdown(self):
+        self.stop()
+        self.started = False
+
+    def reload(self):
+        """
+        Fetch the layout and dependencies again then fire the initial
+        callbacks, the same as a page load.
+
+        :return:
+        """
+        layout = self._get('_dash-layout')
+        self.dependencies = [
+            _parse_dependency(x) for x in self._get('_dash-dependencies')
+        ]
+        self.props = _walk_components(layout, {})
+        self._run_callbacks(self._triggered_by_components(self.props))
+
+    def get_prop(self, component_id, prop_name):
+        """
+        Get the current value of a component property.
+
+        :param component_id: Id of the component.
+        :type component_id: str
+        :param prop_name: Name of the property.
+        :type prop_name: str
+        :return: The property value, None if it was never set.
+        """
+        return self.props.get(component_id, {}).get(prop_name)
+
+    def set_prop(self, component_id, prop_name, value):
+        """
+        Set a component property like a user input would and fire the
+        callbacks depending on it.
+
+        :Example:
+
+            >>> dash_in_process.set_prop('input', 'value', 'Hello')
+            >>> dash_in_process.get_prop('output', 'children')
+
+        :param component_id: Id of the component.
+        :type component_id: str
+        :param prop_name: Name of the property.
+        :type prop_name: str
+        :param value: New value of the property.
+        :return: The updated properties keyed by ``(id, prop)``.
+        :rtype: dict
+        """
+        self.props.setdefault(component_id, {})[prop_name] = value
+        return self._run_callbacks(
+            self._triggered_by({(component_id, prop_name)})
+        )
+
+    def _url(self, endpoint):
+        prefix = self.app.config.get('routes_pathname_prefix') or '/'
+        return '{}{}'.format(prefix, endpoint)
+
+    def _get(self, endpoint):
+        response = self.client.get(self._url(endpoint))
+        if response.status_code != 200:
+            raise errors.DashAppLoadingError(
+                'Could not load {}: {}\n\n{}'.format(
+                    endpoint, response.status_code,
+                    response.get_data(as_text=True)
+                )
+            )
+        return json.loads(response.get_data(as_text=True))
+
+    def _triggered_by(self, changed):
+        return [
+            x for x in self.dependencies if changed.intersection(x['inputs'])
+        ]
+
+    def _triggered_by_components(self, components):
+        # Callbacks with an input in newly rendered components.
+        return [
+            x for x in self.dependencies
+            if any(_id in components for _id, _ in x['inputs'])
+        ]
+
+    def _run_callbacks(self, pending):
+        updated = {}
+        count = 0
+
+        while pending:
+            # Fire first the callbacks without inputs waiting on the
+            # outputs of another pending callback.
+            ready = [
+                x for x in pending if not any(
+                    set(x['inputs']).intersection(y['outputs'])
+                    for y in pending if y is not x
+                )
+            ]
+            dependency = (ready or pending)[0]
+            pending = [x for x in pending if x is not dependency]
+
+            count += 1
+            if count > self.max_callbacks:
+                raise errors.CallbackError(
+                    'More than {} chained callbacks fired'.format(
+                        self.max_callbacks
+                    )
+                )
+
+            changes = self._fire(dependency)
+            updated.update(changes)
+
+            new_components = {}
+            for value in six.itervalues(changes):
+                _walk_components(value, new_components)
+            self.props.update(new_components)
+
+            for triggered in itertools.chain(
+                    self._triggered_by(set(changes)),
+                    self._triggered_by_components(new_components)):
+                if not any(triggered is x for x in pending):
+                    pending.append(triggered)
+
+        return updated
+
+    def _fire(self, dependency):
+        # Call the callback and apply the updated props.
+        if not all(_id in self.props for _id, _ in dependency['inputs']):
+            return {}
+
+        payload = _callback_payload(dependency, self.get_prop)
+        response = self.client.post(
+            self._url('_dash-update-component'),
+            data=json.dumps(payload),
+            content_type='application/json'
+        )
+        self.callback_count += 1
+
+        if response.status_code == 204:
+            # PreventUpdate
+            return {}
+        if response.status_code != 200:
+            raise errors.CallbackError(
+                'Callback for {} failed: {}\n\n{}'.format(
+                    dependency['output'], response.status_code,
+                    response.get_data(as_text=True)
+                )
+            )
+
+        data = json.loads(response.get_data(as_text=True))
+        body = data['response']
+        if not data.get('multi'):
+            # Single output response, `{'props': {prop_name: value}}`
+            body = {dependency['outputs'][0][0]: body['props']}
+
+        changes = {}
+        for _id, props in six.iteritems(body):
+            for prop, value in six.iteritems(props):
+                self.props.setdefault(_id, {})[prop] = value
+                changes[(_id, prop)] = value
+        return changes
@@ -0,0 +1,329 @@
+"""
+Server side requests instrumentation for the dash runners.
+
+The wsgi application of the dash server is wrapped with a
+:py:class:`RequestRecorder` recording the path, status, sizes and duration
+of every request, independently of the selenium driver used.
+"""
+import collections
+import importlib
+import io
+import json
+import os
+import threading
+import time
+
+RequestRecord = collections.namedtuple(
+    'RequestRecord', [
+        'start', 'method', 'path', 'kind', 'callback', 'status',
+        'request_size', 'response_size', 'duration'
+    ]
+)
+
+# Environment variables of the instrumented subprocess app factory.
+_app_env = 'PYTEST_DASH_RECORD_APP'
+_log_env = 'PYTEST_DASH_RECORD_LOG'
+
+
+def _request_kind(path):
+    if path.endswith('/_dash-update-component'):
+        return 'callback'
+    if path.endswith('/_dash-layout'):
+        return 'layout'
+    if path.endswith('/_dash-dependencies'):
+        return 'dependencies'
+    if '/_dash-component-suites/' in path or '/assets/' in path \
+            or path.endswith('/favicon.ico'):
+        return 'asset'
+    return 'page'
+
+
+def _callback_output(body):
+    # The output of a callback request, `id.prop` or the multi outputs.
+    try:
+        output = json.loads(body.decode('utf-8')).get('output')
+    except (ValueError, AttributeError):
+        return None
+    if isinstance(output, dict):
+        # Older dash versions.
+        return '{}.{}'.format(output.get('id'), output.get('property'))
+    return output
+
+
+class RequestLog(object):
+    """
+    Requests recorded by a :py:class:`RequestRecorder`.
+
+    The records are kept in memory or read from the json lines file
+    written by an instrumented subprocess.
+    """
+
+    def __init__(self, path=None):
+        """
+        :param path: Json lines file to read the records from.
+        :type path: str
+        """
+        self.path = path
+        self._records = []
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def add(self, record):
+        """
+        :param record: The request to add.
+        :type record: RequestRecord
+        :return:
+        """
+        with self._lock:
+            self._records.append(record)
+
+    def _load(self):
+        # Read the records appended to the file since the last load,
+        # called with the lock held.
+        if not self.path or not os.path.exists(self.path):
+            return
+        with io.open(self.path, 'rb') as f:
+            f.seek(self._offset)
+            data = f.read()
+        # Leave an incomplete line for the next load.
+        end = data.rfind(b'\n') + 1
+        self._offset += end
+        for line in data[:end].splitlines():
+            self._records.append(
+                RequestRecord(**json.loads(line.decode('utf-8')))
+            )
+
+    @property
+    def records(self):
+        """
+        The recorded requests, the new records of the file are loaded
+        first.
+
+        :return: The recorded requests.
+        :rtype: list
+        """
+        with self._lock:
+            self._load()
+            return list(self._records)
+
+    def since(self, start=None):
+        """
+        :param start: Only the requests started after this time.
+        :type start: float
+        :return: The recorded requests.
+        :rtype: list
+        """
+        return [x for x in self.records if start is None or x.start >= start]
+
+    def clear(self):
+        """
+        Discard the recorded requests, including the ones written to the
+        file and not loaded yet.
+
+        :return:
+        """
+        with self._lock:
+            self._load()
+            self._records = []
+
+    def close(self):
+        """
+        Load the records left in the file and remove it.
+
+        :return:
+        """
+        with self._lock:
+            self._load()
+            path, self.path = self.path, None
+        try:
+            os.remove(path)
+        except OSError:  # pragma: no cover
+            pass
+
+    def callbacks(self, start=None):
+        """
+        Aggregate the callback requests by output.
+
+        :param start: Only the requests started after this time.
+        :type start: float
+        :return: ``{output: {count, total_time, max_time, max_size}}``
+            sorted by total time, slowest first.
+        :rtype: collections.OrderedDict
+        """
+        stats = {}
+        for record in self.since(start):
+            if record.kind != 'callback':
+                continue
+            stat = stats.setdefault(
+                record.callback, {
+                    'count': 0,
+                    'total_time': 0.0,
+                    'max_time': 0.0,
+                    'max_size': 0
+                }
+            )
+            stat['count'] += 1
+            stat['total_time'] += record.duration
+            stat['max_time'] = max(stat['max_time'], record.duration)
+            stat['max_size'] = max(stat['max_size'], record.response_size)
+        return collections.OrderedDict(
+            sorted(stats.items(), key=lambda x: -x[1]['total_time'])
+        )
+
+    def summary(self, start=None):
+        """
+        :param start: Only the requests started after this time.
+        :type start: float
+        :return: Formatted summary of the requests by kind and callback.
+        :rtype: str
+        """
+        records = self.since(start)
+        lines = []
+        kinds = collections.OrderedDict()
+        for record in records:
+            kinds.setdefault(record.kind, []).append(record)
+        for kind, kind_records in kinds.items():
+            lines.append(
+                '{}: {} requests, {:.4f}s, {} bytes'.format(
+                    kind, len(kind_records),
+                    sum(x.duration for x in kind_records),
+                    sum(x.response_size for x in kind_records)
+                )
+            )
+        for output, stat in self.callbacks(start).items():
+            lines.append(
+                '  {}: {count} calls, {total_time:.4f}s total, '
+                '{max_time:.4f}s max, {max_size} bytes max'.format(
+                    output, **stat
+                )
+            )
+        return '\n'.join(lines)
+
+    def assert_response_size(self, max_size, kind='callback', start=None):
+        """
+        Assert the responses are smaller than a budget in bytes.
+
+        :param max_size: Maximum response size.
+        :type max_size: int
+        :param kind: Kind of requests to check (``callback``, ``layout``,
+            ``dependencies``, ``asset``, ``page``), None for all.
+        :type kind: str
+        :param start: Only the requests started after this time.
+        :type start: float
+        :raise: AssertionError
+        """
+        over = [
+            '{} {} ({}): {} bytes'.format(
+                x.method, x.path, x.callback or x.kind, x.response_size
+            ) for x in self.since(start)
+            if (kind is None or x.kind == kind) and x.response_size > max_size
+        ]
+        assert not over, 'Responses over {} bytes:\n{}'.format(
+            max_size, '\n'.join(over)
+        )
+
+
+class _RecordedResponse(object):
+    # Response iterable counting the bytes sent, the request is recorded
+    # when the server closes it.
+
+    def __init__(self, recorder, environ, iterable, info):
+        self.recorder = recorder
+        self.environ = environ
+        self.iterable = iterable
+        self.info = info
+        self.size = 0
+
+    def __iter__(self):
+        for chunk in self.iterable:
+            self.size += len(chunk)
+            yield chunk
+
+    def close(self):
+        """Close the application response and record the request."""
+        try:
+            if hasattr(self.iterable, 'close'):
+                self.iterable.close()
+        finally:
+            self.recorder.record(self.environ, self.info, self.size)
+
+
+class RequestRecorder(object):
+    """Wsgi middleware recording the requests of an application."""
+
+    def __init__(self, app, log=None, path=None):
+        """
+        :param app: The wsgi application (eg: ``dash_app.server``).
+        :param log: Log to add the records to.
+        :type log: RequestLog
+        :param path: Json lines file to append the records to.
+        :type path: str
+        """
+        self.app = app
+        self.log = log
+        self.path = path
+        self._lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        info = {'start': time.time(), 'status': None, 'request_size': 0}
+        if _request_kind(environ.get('PATH_INFO', '')) == 'callback':
+            # Read the body to get the callback output and replace the
+            # input stream for the application.
+            length = int(environ.get('CONTENT_LENGTH') or 0)
+            body = environ['wsgi.input'].read(length) if length else b''
+            environ['wsgi.input'] = io.BytesIO(body)
+            info['callback'] = _callback_output(body)
+        info['request_size'] = int(environ.get('CONTENT_LENGTH') or 0)
+
+        def _start_response(status, headers, exc_info=None):
+            info['status'] = int(status.split(' ', 1)[0])
+            return start_response(status, headers, exc_info)
+
+        iterable = self.app(environ, _start_response)
+        return _RecordedResponse(self, environ, iterable, info)
+
+    def record(self, environ, info, size):
+        """
+        Add a finished request to the log and the file.
+
+        :param environ: The wsgi environ of the request.
+        :type environ: dict
+        :param info: Start time, status, request size and callback output
+            of the request.
+        :type info: dict
+        :param size: Size of the response body.
+        :type size: int
+        :return:
+        """
+        path = environ.get('PATH_INFO', '')
+        record = RequestRecord(
+            start=info['start'],
+            method=environ.get('REQUEST_METHOD'),
+            path=path,
+            kind=_request_kind(path),
+            callback=info.get('callback'),
+            status=info['status'],
+            request_size=info['request_size'],
+            response_size=size,
+            duration=time.time() - info['start'],
+        )
+        if self.log is not None:
+            self.log.add(record)
+        if self.path:
+            line = json.dumps(record._asdict()) + '\n'
+            with self._lock, io.open(self.path, 'ab') as f:
+                f.write(line.encode('utf-8'))
+
+
+def create_recorded_app():
+    """
+    Factory of the instrumented app for ``waitress-serve --call``.
+
+    The application to import and the file to write the records to are
+    read from the environment.
+
+    :return: The wsgi application wrapped in a :py:class:`RequestRecorder`.
+    """
+    app_module, application_name = os.environ[_app_env].split(':')
+    app = getattr(importlib.import_module(app_module), application_name)
+    return RequestRecorder(app.server, path=os.environ[_log_env])
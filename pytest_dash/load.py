@@ -0,0 +1,294 @@
+"""
+Concurrent load tests for the callbacks of a running dash application.
+
+Payloads are posted to ``/_dash-update-component`` from a pool of threads
+or processes and the latencies are collected in a :py:class:`LoadResult`.
+"""
+import math
+import multiprocessing
+import threading
+import time
+from multiprocessing.pool import ThreadPool
+
+import requests
+
+from pytest_dash.in_process import _parse_dependency, _callback_payload
+
+
+def _post(args):
+    # Post a payload and return the (latency, error) of the request.
+    url, payload, timeout, session = args
+    start = time.time()
+    error = None
+    try:
+        response = session.post(url, json=payload, timeout=timeout)
+        if response.status_code not in (200, 204):
+            error = '{}: {}'.format(response.status_code, response.text)
+    except requests.RequestException as err:
+        error = str(err)
+    return time.time() - start, error
+
+
+class _ThreadSessions(object):
+    # Keep-alive session for every thread of a pool, closed after the run.
+
+    def __init__(self):
+        self.sessions = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def get(self):
+        """
+        :return: The session of the current thread.
+        :rtype: requests.Session
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            with self._lock:
+                self.sessions.append(session)
+        return session
+
+    def close(self):
+        """
+        Close the sessions of all the threads.
+
+        :return:
+        """
+        with self._lock:
+            sessions, self.sessions = self.sessions, []
+        for session in sessions:
+            session.close()
+
+
+def _post_threaded(args):
+    sessions = args[-1]
+    return _post(args[:-1] + (sessions.get(), ))
+
+
+def _post_process(args):
+    return _post(args + (requests, ))
+
+
+def _post_all(tasks, mode, workers):
+    # Post the tasks from a pool, return the responses and the duration.
+    sessions = None
+    if mode == 'thread':
+        sessions = _ThreadSessions()
+        tasks = [x + (sessions, ) for x in tasks]
+        pool, post = ThreadPool(workers), _post_threaded
+    elif mode == 'process':
+        pool, post = multiprocessing.Pool(workers), _post_process
+    else:
+        raise ValueError('Invalid load mode: {}'.format(mode))
+
+    start = time.time()
+    try:
+        responses = pool.map(post, tasks)
+    finally:
+        pool.close()
+        pool.join()
+        if sessions is not None:
+            sessions.close()
+    return responses, time.time() - start
+
+
+def percentile(values, percent):
+    """
+    Nearest-rank percentile of the values.
+
+    :param values: Values to rank.
+    :type values: list
+    :param percent: Percentile to get, between 0 and 100.
+    :type percent: float
+    :return: The value at the percentile, None if there is no values.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = int(math.ceil(percent / 100.0 * len(ordered)))
+    return ordered[max(rank, 1) - 1]
+
+
+class LoadResult(object):
+    """Latencies and errors of a load run."""
+
+    def __init__(self, latencies, errors, duration):
+        """
+        :param latencies: Time of every request in seconds.
+        :type latencies: list
+        :param errors: Error messages of the failed requests.
+        :type errors: list
+        :param duration: Total time of the run in seconds.
+        :type duration: float
+        """
+        self.latencies = latencies
+        self.errors = errors
+        self.duration = duration
+
+    @property
+    def count(self):
+        """Number of requests."""
+        return len(self.latencies)
+
+    @property
+    def throughput(self):
+        """Requests per second."""
+        return self.count / self.duration if self.duration else 0.0
+
+    @property
+    def p50(self):
+        """Median latency."""
+        return percentile(self.latencies, 50)
+
+    @property
+    def p95(self):
+        """95th percentile latency."""
+        return percentile(self.latencies, 95)
+
+    @property
+    def p99(self):
+        """99th percentile latency."""
+        return percentile(self.latencies, 99)
+
+    @property
+    def max(self):
+        """Latency of the slowest request."""
+        return max(self.latencies) if self.latencies else None
+
+    def summary(self):
+        """
+        :return: Formatted summary of the run.
+        :rtype: str
+        """
+        return (
+            '{} requests in {:.3f}s ({:.1f} req/s), {} errors, '
+            'p50={:.4f}s p95={:.4f}s p99={:.4f}s max={:.4f}s'.format(
+                self.count, self.duration, self.throughput, len(self.errors),
+                self.p50 or 0, self.p95 or 0, self.p99 or 0, self.max or 0
+            )
+        )
+
+    def assert_no_errors(self):
+        """
+        Assert all the requests succeeded.
+
+        :raise: AssertionError
+        """
+        assert not self.errors, '{} failed requests:\n{}\n{}'.format(
+            len(self.errors), '\n'.join(self.errors[:10]), self.summary()
+        )
+
+    def assert_latency(self, p50=None, p95=None, p99=None, max_latency=None):
+        """
+        Assert the latencies are under the budgets in seconds.
+
+        :Example:
+
+            >>> result.assert_latency(p95=0.2, p99=0.5)
+
+        :param p50: Median budget.
+        :param p95: 95th percentile budget.
+        :param p99: 99th percentile budget.
+        :param max_latency: Budget for the slowest request.
+        :raise: AssertionError
+        """
+        budgets = (
+            ('p50', self.p50, p50),
+            ('p95', self.p95, p95),
+            ('p99', self.p99, p99),
+            ('max', self.max, max_latency),
+        )
+        over = [
+            '{}={:.4f}s > {}s'.format(name, value, budget)
+            for name, value, budget in budgets
+            if budget is not None and value is not None and value > budget
+        ]
+        assert not over, 'Latency budget exceeded: {}\n{}'.format(
+            ', '.join(over), self.summary()
+        )
+
+    def __repr__(self):
+        return '<LoadResult {}>'.format(self.summary())
+
+
+class DashLoad(object):
+    """Fire callback payloads concurrently at a running dash application."""
+
+    def __init__(self):
+        self.results = []
+
+    @staticmethod
+    def payload(runner, output, values=None, timeout=10):
+        """
+        Create the payload of a callback from the app dependencies.
+
+        :Example:
+
+            >>> dash_load.payload(dash_threaded, 'out.children', {
+            ...     'value.value': 'Hello'
+            ... })
+
+        :param runner: A started runner.
+        :type runner: pytest_dash.application_runners.BaseDashRunner
+        :param output: Output of the callback as ``component_id.prop_name``,
+            one of the outputs for multi outputs callbacks.
+        :type output: str
+        :param values: Values of the inputs and states keyed by
+            ``component_id.prop_name``.
+        :type values: dict
+        :param timeout: Timeout of the dependencies request.
+        :type timeout: float
+        :return: The request body.
+        :rtype: dict
+        """
+        values = values or {}
+        response = requests.get(
+            '{}/_dash-dependencies'.format(runner.url), timeout=timeout
+        )
+        response.raise_for_status()
+        output_id = tuple(output.rsplit('.', 1))
+
+        for dependency in response.json():
+            parsed = _parse_dependency(dependency)
+            if output_id in parsed['outputs']:
+                return _callback_payload(
+                    parsed, lambda _id, prop: values.
+                    get('{}.{}'.format(_id, prop))
+                )
+
+        raise ValueError('No callback found for output {}'.format(output))
+
+    def __call__(
+            self, runner, payloads, repeat=1, workers=4, mode='thread',
+            timeout=10
+    ):
+        """
+        Post the payloads to the ``/_dash-update-component`` endpoint.
+
+        :param runner: A started ``DashThreaded`` or ``DashSubprocess``.
+        :type runner: pytest_dash.application_runners.BaseDashRunner
+        :param payloads: Request bodies to post.
+        :type payloads: list
+        :param repeat: Number of times to post every payload.
+        :type repeat: int
+        :param workers: Number of concurrent threads or processes.
+        :type workers: int
+        :param mode: ``thread`` or ``process``.
+        :type mode: str
+        :param timeout: Timeout of a single request.
+        :type timeout: float
+        :return: Result of the run.
+        :rtype: LoadResult
+        """
+        url = '{}/_dash-update-component'.format(runner.url)
+        tasks = [(url, payload, timeout) for payload in payloads] * repeat
+        responses, duration = _post_all(tasks, mode, workers)
+
+        result = LoadResult(
+            [latency for latency, _ in responses],
+            [error for _, error in responses if error],
+            duration,
+        )
+        self.results.append(result)
+        return result
@@ -7,30 +7,35 @@ Main entry point for pytest
 - Plugin config container
 - Plugin selenium driver
 - Fixtures
+
+The plugin is loaded on every pytest run; selenium, dash and the
+behavior parser are only imported when a dash fixture or yaml test is used.
 """
+import shutil
+import sys
+import time
+import warnings
+
 import pytest
 
-from selenium import webdriver
-
-from pytest_dash.behaviors import DashBehaviorTestFile
-from pytest_dash.errors import InvalidDriverError
-from pytest_dash.application_runners import DashThreaded, DashSubprocess
-
-_driver_map = {
-    'Chrome': webdriver.Chrome,
-    'Firefox': webdriver.Firefox,
-    'Remote': webdriver.Remote,
-    'Safari': webdriver.Safari,
-    'Opera': webdriver.Opera,
-    'PhantomJS': webdriver.PhantomJS,
-    'Edge': webdriver.Edge,
-    'Ie': webdriver.Ie,
-}
+from pytest_dash.drivers import (
+    DriverPool, ConsoleLogCollector, browser_options, reset_browser,
+    attach_console_logs, drain_console_logs, format_console_entries,
+    _driver_options
+)
+from pytest_dash.errors import InvalidDriverError, PytestDashError
+
+# Name of the selenium.webdriver classes, imported when the driver is created.
+_driver_map = (
+    'Chrome', 'Firefox', 'Remote', 'Safari', 'Opera', 'PhantomJS', 'Edge', 'Ie'
+)
 
 
 def _create_config(parser, key, _help=None):
     # Create an option for pytest command line and ini
-    parser.addoption('--{}'.format(key), help=_help)
+    parser.addoption(
+        '--{}'.format(key.replace('_', '-')), dest=key, help=_help
+    )
     parser.addini(key, help=_help)
 
 
@@ -40,6 +45,72 @@ def _get_config(config, key, default=None):
     return opt or ini or default
 
 
+def _is_true(value):
+    return str(value).lower() in ('1', 'true', 'yes', 'on')
+
+
+def _parse_port_range(value):
+    # Parse a `start-end` range of ports.
+    if not value:
+        return None
+    try:
+        start, end = (int(x) for x in value.split('-'))
+    except ValueError:
+        raise PytestDashError(
+            'Invalid dash_port_range: {}, format is `start-end`'.format(value)
+        )
+    return start, end
+
+
+def _parse_window_size(value):
+    # Parse a `widthxheight` window size.
+    if not value:
+        return None
+    try:
+        width, height = (int(x) for x in value.lower().split('x'))
+    except ValueError:
+        raise PytestDashError(
+            'Invalid dash_window_size: {}, format is `widthxheight`'.
+            format(value)
+        )
+    return width, height
+
+
+# Fixtures using a selenium driver.
+_driver_fixtures = {
+    'dash_threaded',
+    'dash_subprocess',
+    'dash_threaded_module',
+    'dash_threaded_session',
+}
+
+
+def _uses_driver(item):
+    # Dash fixtures or behavior tests.
+    behaviors = sys.modules.get('pytest_dash.behaviors')
+    if behaviors and isinstance(item, behaviors.DashBehaviorTestItem):
+        return True
+    fixtures = getattr(item, 'fixturenames', ())
+    return bool(_driver_fixtures.intersection(fixtures))
+
+
+def _item_runners(item):
+    # The dash runners used by a test, from the fixtures or behavior item.
+    runners_module = sys.modules.get('pytest_dash.application_runners')
+    if runners_module is None:
+        # No runners were ever created.
+        return []
+    base_runner = runners_module.BaseDashRunner
+    runners = [
+        x for x in getattr(item, 'funcargs', {}).values()
+        if isinstance(x, base_runner)
+    ]
+    runner = getattr(item, 'runner', None)
+    if runner is not None:
+        runners.append(runner)
+    return runners
+
+
 ###############################################################################
 # Plugin hooks.
 ###############################################################################
@@ -48,8 +119,108 @@ def _get_config(config, key, default=None):
 # pylint: disable=missing-docstring
 def pytest_addoption(parser):
     # Add options to the pytest parser, either on the commandline or ini
-    # TODO add more options for the selenium driver.
     _create_config(parser, 'webdriver', 'Name of the selenium driver to use')
+    _create_config(
+        parser, 'dash_wait_mode',
+        'How the wait_for helpers wait: poll (default) or observer to'
+        ' return on the DOM mutations'
+    )
+    _create_config(
+        parser, 'dash_wait_timeout',
+        'Default timeout in seconds of the waits (default 10)'
+    )
+    _create_config(
+        parser, 'dash_poll_frequency',
+        'Time in seconds between two polls of the waits (default 0.5)'
+    )
+    _create_config(
+        parser, 'dash_poll_backoff',
+        'Poll fast first then double the delay up to the poll frequency'
+        ' (true/false)'
+    )
+    _create_config(
+        parser, 'dash_test_timeout',
+        'Time budget in seconds of every dash test, the waits use the'
+        ' remaining time as their timeout'
+    )
+    _create_config(
+        parser, 'dash_wait_summary',
+        'Number of the slowest waits and the tests closest to their timeout'
+        ' to list at the end of the session, 0 to disable (default)'
+    )
+    _create_config(
+        parser, 'dash_wait_report',
+        'Write the duration, polls and timeouts of all the waits to this'
+        ' json file'
+    )
+    _create_config(
+        parser, 'dash_headless',
+        'Run the Chrome or Firefox browser in headless mode (true/false)'
+    )
+    _create_config(
+        parser, 'dash_window_size', 'Size of the browser window (eg: 1280x720)'
+    )
+    _create_config(
+        parser, 'dash_page_load_strategy',
+        'Selenium page load strategy: normal, eager or none'
+    )
+    _create_config(
+        parser, 'dash_disable_images',
+        'Don\'t load the images in Chrome or Firefox (true/false)'
+    )
+    _create_config(
+        parser, 'dash_disable_extensions',
+        'Disable the Chrome or Firefox extensions (true/false)'
+    )
+    _create_config(
+        parser, 'dash_profile_dir',
+        'Directory to create the browser profiles in (eg: /dev/shm)'
+    )
+    _create_config(
+        parser, 'dash_port_range',
+        'Range of ports (eg: 9000-9999) to use for `port=\'auto\'`,'
+        ' split between the xdist workers.'
+    )
+    _create_config(
+        parser, 'dash_cache_imports',
+        'Cache the apps imported with import_app for the session (true/false)'
+    )
+    _create_config(
+        parser, 'dash_driver_pool_size',
+        'Maximum number of selenium drivers open at the same time'
+    )
+    _create_config(
+        parser, 'dash_prewarm_drivers',
+        'Number of selenium drivers to start in the background once the dash'
+        ' tests are collected, 0 to disable (default 1)'
+    )
+    _create_config(
+        parser, 'dash_reset_browser',
+        'Clear the browser storages, cookies and page after every test'
+        ' (true/false)'
+    )
+    _create_config(
+        parser, 'dash_console_log_size',
+        'Maximum number of browser console entries kept for a test,'
+        ' 0 to disable the collection (default 1000)'
+    )
+    _create_config(
+        parser, 'dash_fail_on_console_errors',
+        'Fail the tests with SEVERE browser console entries (true/false)'
+    )
+    _create_config(
+        parser, 'dash_record_requests',
+        'Record the requests of the dash servers, the summary is added to the'
+        ' report of failed tests (true/false)'
+    )
+    _create_config(
+        parser, 'dash_server_backend',
+        'Server backend of dash_threaded: werkzeug, waitress or wsgiref'
+    )
+    _create_config(
+        parser, 'dash_server_threads',
+        'Number of threads for the waitress server backend'
+    )
 
 
 # pylint: disable=too-few-public-methods
@@ -57,18 +228,84 @@ class DashPlugin(object):
     """Plugin configuration and selenium driver container"""
 
     def __init__(self):
-        self._driver = None
+        self.driver_pool = None
         self.config = None
         self.behaviors = {}
-        self._driver_name = None
+        self.settings = {}
+        self._server_pool = None
+        self._test_start_time = None
+        self._profile_dirs = []
 
     # pylint: disable=missing-docstring
     def pytest_configure(self, config):
         self.config = config
         # Called once before the tests are run
         # Get and configure global objects for the plugin to use.
-        # TODO get all the options and map a global dict.
-        self._driver_name = _get_config(config, 'webdriver')
+        port_range = _parse_port_range(_get_config(config, 'dash_port_range'))
+        record_requests = _is_true(_get_config(config, 'dash_record_requests'))
+        test_timeout = _get_config(config, 'dash_test_timeout')
+        self.settings = {
+            'driver_name':
+            _get_config(config, 'webdriver'),
+            'browser_options': {
+                'headless':
+                _is_true(_get_config(config, 'dash_headless')),
+                'window_size':
+                _parse_window_size(_get_config(config, 'dash_window_size')),
+                'page_load_strategy':
+                _get_config(config, 'dash_page_load_strategy'),
+                'disable_images':
+                _is_true(_get_config(config, 'dash_disable_images')),
+                'disable_extensions':
+                _is_true(_get_config(config, 'dash_disable_extensions')),
+                'profile_dir':
+                _get_config(config, 'dash_profile_dir'),
+            },
+            # Keyword arguments of the threaded and subprocess runners.
+            'threaded': {
+                'port_range': port_range,
+                'backend':
+                _get_config(config, 'dash_server_backend', 'werkzeug'),
+                'threads': int(_get_config(config, 'dash_server_threads', 4)),
+                'record_requests': record_requests,
+            },
+            'subprocess': {
+                'port_range': port_range,
+                'stream_output': config.getoption('capture') == 'no',
+                'record_requests': record_requests,
+            },
+            'reset_browser':
+            _is_true(_get_config(config, 'dash_reset_browser')),
+            'prewarm_drivers':
+            int(_get_config(config, 'dash_prewarm_drivers', 1)),
+            'console_log_size':
+            int(_get_config(config, 'dash_console_log_size', 1000)),
+            'fail_on_console_errors':
+            _is_true(_get_config(config, 'dash_fail_on_console_errors')),
+            'test_timeout':
+            float(test_timeout) if test_timeout else None,
+            'wait_summary':
+            int(_get_config(config, 'dash_wait_summary', 0)),
+            'wait_report':
+            _get_config(config, 'dash_wait_report'),
+        }
+        self.driver_pool = DriverPool(
+            self._create_driver,
+            size=int(_get_config(config, 'dash_driver_pool_size', 1))
+        )
+        self._configure_waits(config)
+        config.addinivalue_line(
+            'markers',
+            'dash_timeout(seconds): time budget of the test waits and dash'
+            ' application starts'
+        )
+        if self.settings['wait_summary'] or self.settings['wait_report']:
+            from pytest_dash.wait_report import wait_recorder
+            wait_recorder.enabled = True
+        if _is_true(_get_config(config, 'dash_cache_imports')):
+            # pylint: disable=protected-access
+            from pytest_dash import application_runners
+            application_runners._import_cache.enabled = True
 
         # pylint: disable=invalid-name, no-self-argument
         class _AddBehavior:
@@ -90,37 +327,232 @@ class DashPlugin(object):
 
         config.hook.pytest_add_behaviors(add_behavior=_AddBehavior)
 
+    # pylint: disable=missing-docstring
+    def pytest_collection_finish(self, session):
+        # Start the browsers while the first tests and servers start.
+        prewarm = self.settings['prewarm_drivers']
+        if prewarm < 1 or session.config.option.collectonly:
+            return
+        dash_items = sum(1 for x in session.items if _uses_driver(x))
+        if dash_items:
+            self.driver_pool.prewarm(min(prewarm, dash_items))
+
+    # pylint: disable=unused-argument, missing-docstring
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        self._test_start_time = time.time()
+        # Discard the logs left by the previous test.
+        for collector in self._console_collectors(force=True):
+            collector.clear()
+        budget = self._time_budget(item)
+        if budget:
+            from pytest_dash.wait_for import set_time_budget
+            set_time_budget(budget)
+
+    # pylint: disable=unused-argument, missing-docstring
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        if self.settings['reset_browser']:
+            # Before the fixtures teardown, the drivers kept by the module
+            # and session fixtures are not returned to the pool.
+            self._reset_item_drivers(item)
+        yield
+        # Also clear a budget set by the test itself.
+        wait_for = sys.modules.get('pytest_dash.wait_for')
+        if wait_for is not None:
+            wait_for.set_time_budget(None)
+
+    def _reset_item_drivers(self, item):
+        runners = _item_runners(item)
+        drivers = [self.driver_pool.current(), getattr(item, 'driver', None)]
+        drivers.extend(x.driver for x in runners)
+        reset = []
+        for driver in drivers:
+            if driver is None or any(x is driver for x in reset):
+                continue
+            reset.append(driver)
+            try:
+                reset_browser(driver)
+            except Exception:  # pylint: disable=broad-except
+                # The browser is broken, replace it with a new one for
+                # the fixtures still holding it.
+                new_driver = self.driver_pool.replace(driver)
+                for runner in runners:
+                    if new_driver is not None and runner.driver is driver:
+                        runner.driver = new_driver
+
+    # pylint: disable=unused-argument, missing-docstring
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        # Add the output of the dash runners to the failed tests report.
+        outcome = yield
+        report = outcome.get_result()
+        check_console = self.settings['fail_on_console_errors'] and \
+            report.when == 'call' and report.passed
+        if not report.failed and not check_console:
+            return
+
+        console_entries = []
+        for collector in self._console_collectors(force=True):
+            console_entries.extend(collector.entries(self._test_start_time))
+
+        if check_console:
+            severe = [x for x in console_entries if x.get('level') == 'SEVERE']
+            if not severe:
+                return
+            report.outcome = 'failed'
+            report.longrepr = 'Severe browser console entries:\n{}'.format(
+                format_console_entries(severe)
+            )
+
+        for runner in _item_runners(item):
+            for section in runner.report_sections(self._test_start_time):
+                report.sections.append(section)
+        if console_entries:
+            report.sections.append((
+                'Captured browser console logs',
+                format_console_entries(console_entries)
+            ))
+
+    # pylint: disable=unused-argument, missing-docstring
+    def pytest_sessionfinish(self, session):
+        # Stop the servers kept alive for the behavior tests.
+        if self._server_pool:
+            self._server_pool.stop()
+        if self.settings['wait_report']:
+            from pytest_dash.wait_report import wait_recorder
+            wait_recorder.dump(self.settings['wait_report'])
+
+    # pylint: disable=missing-docstring
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.settings['wait_summary']:
+            return
+        from pytest_dash.wait_report import wait_recorder
+        if not wait_recorder.records:
+            return
+        terminalreporter.write_sep('=', 'dash waits')
+        terminalreporter.write_line(
+            wait_recorder.summary(self.settings['wait_summary'])
+        )
+
     # pylint: disable=unused-argument, missing-docstring
     def pytest_unconfigure(self, config):
-        # Quit the selenium driver once all tests are cleared.
-        if self._driver:
-            self.driver.quit()
+        # Quit the selenium drivers once all tests are cleared.
+        if self.driver_pool:
+            self.driver_pool.quit()
+        for profile in self._profile_dirs:
+            shutil.rmtree(profile, ignore_errors=True)
 
     # pylint: disable=inconsistent-return-statements, missing-docstring
     def pytest_collect_file(self, parent, path):
         if path.ext == ".yml" and path.basename.startswith("test"):
+            from pytest_dash.behaviors import DashBehaviorTestFile
             return DashBehaviorTestFile(path, parent, self)
 
+    @staticmethod
+    def _configure_waits(config):
+        # The wait_for module imports selenium, only import it to
+        # change the default settings.
+        wait_mode = _get_config(config, 'dash_wait_mode')
+        timeout = _get_config(config, 'dash_wait_timeout')
+        poll_frequency = _get_config(config, 'dash_poll_frequency')
+        backoff = _get_config(config, 'dash_poll_backoff')
+        if not any((wait_mode, timeout, poll_frequency, backoff)):
+            return
+
+        if wait_mode and wait_mode not in ('poll', 'observer'):
+            raise PytestDashError(
+                'Invalid dash_wait_mode: {}, use poll or observer'.
+                format(wait_mode)
+            )
+        # pylint: disable=protected-access
+        from pytest_dash import wait_for
+        settings = wait_for._settings
+        settings.mode = wait_mode or settings.mode
+        settings.timeout = float(timeout or settings.timeout)
+        settings.poll_frequency = float(
+            poll_frequency or settings.poll_frequency
+        )
+        settings.backoff = _is_true(backoff)
+
+    def _time_budget(self, item):
+        # The marker, then the yaml behavior timeout, then the option.
+        marker = item.get_closest_marker('dash_timeout')
+        if marker is not None:
+            return float(marker.args[0])
+        behavior_budget = getattr(item, 'time_budget', None)
+        if behavior_budget:
+            return float(behavior_budget)
+        return self.settings['test_timeout'] if _uses_driver(item) else None
+
+    def _console_collectors(self, force=False):
+        # Drain the console logs of the opened drivers.
+        drivers = self.driver_pool.drivers if self.driver_pool else []
+        collectors = (drain_console_logs(x, force=force) for x in drivers)
+        return [x for x in collectors if x is not None]
+
+    @property
+    def server_pool(self):
+        if self._server_pool is None:
+            from pytest_dash.application_runners import DashSubprocessPool
+            self._server_pool = DashSubprocessPool(
+                **self.settings['subprocess']
+            )
+        return self._server_pool
+
+    def _create_driver(self):
+        driver_name = self.settings['driver_name']
+        if driver_name not in _driver_map:
+            raise InvalidDriverError(  # pragma: no cover
+                '{} is not a valid webdriver value.\n'
+                'Valid drivers {}'.format(driver_name, ', '.join(_driver_map))
+            )
+
+        # The hooks options override the plugin browser options.
+        options, profile = browser_options(
+            driver_name, **self.settings['browser_options']
+        )
+        if profile:
+            self._profile_dirs.append(profile)
+        hooked_options = self.config.hook.pytest_setup_selenium(
+            driver_name=driver_name
+        ) or []
+        for opt in hooked_options:
+            options.update(opt)  # pragma: no cover
+
+        from selenium import webdriver
+        driver = getattr(webdriver, driver_name)(**options)
+        console_log_size = self.settings['console_log_size']
+        if console_log_size > 0:
+            attach_console_logs(
+                driver, ConsoleLogCollector(max_entries=console_log_size)
+            )
+
+        window_size = self.settings['browser_options'].get('window_size')
+        if window_size and driver_name not in _driver_options:
+            # The other drivers get the window size in their options.
+            driver.set_window_size(*window_size)
+        return driver
+
     @property
     def driver(self):
-        if not self._driver:
-            if self._driver_name not in _driver_map:
-                raise InvalidDriverError(  # pragma: no cover
-                    '{} is not a valid webdriver value.\n'
-                    'Valid drivers {}'.format(
-                        self._driver_name, _driver_map.keys()
-                    )
-                )
-
-            options = {}
-            hooked_options = self.config.hook.pytest_setup_selenium(
-                driver_name=self._driver_name
-            ) or []
-            for opt in hooked_options:
-                options.update(opt)  # pragma: no cover
-            self._driver = _driver_map.get(self._driver_name)(**options)
-
-        return self._driver
+        """
+        The driver held by the current thread in a dash fixture or a
+        behavior test.
+
+        .. deprecated:: Use ``driver_pool.driver()`` outside of the
+            fixtures, the driver returned here is not held by the thread.
+        """
+        driver = self.driver_pool.current()
+        if driver is None:
+            warnings.warn(
+                'DashPlugin.driver outside of a dash fixture is deprecated,'
+                ' use the driver_pool.driver() context manager',
+                DeprecationWarning
+            )
+            with self.driver_pool.driver() as driver:
+                pass
+        return driver
 
 
 _plugin = DashPlugin()
@@ -164,10 +596,18 @@ def dash_threaded():
             app.layout = html.Div('My app)
             dash_threaded(app)
 
+    Use ``dash_threaded(app, port='auto')`` to serve on a free port,
+    the url is then available with ``dash_threaded.url``.
+
+    The server backend can be chosen with
+    ``dash_threaded(app, backend='waitress', threads=8)``.
+
     .. seealso:: :py:class:`pytest_dash.application_runners.DashThreaded`
     """
+    from pytest_dash.application_runners import DashThreaded
 
-    with DashThreaded(_plugin.driver) as starter:
+    with _plugin.driver_pool.driver() as driver, DashThreaded(
+            driver, **_plugin.settings['threaded']) as starter:
         yield starter
 
 
@@ -186,5 +626,106 @@ def dash_subprocess():
 
     .. seealso:: :py:class:`pytest_dash.application_runners.DashSubprocess`
     """
-    with DashSubprocess(_plugin.driver) as starter:
+    from pytest_dash.application_runners import DashSubprocess
+
+    with _plugin.driver_pool.driver() as driver, DashSubprocess(
+            driver, **_plugin.settings['subprocess']) as starter:
+        yield starter
+
+
+@pytest.fixture
+def dash_in_process():
+    """
+    Run the callbacks of a dash application without a server or a browser.
+
+    :Example:
+
+    .. code-block:: python
+
+        def test_callbacks(dash_in_process):
+            dash_in_process('test_apps.simple_app')
+            dash_in_process.set_prop('value', 'value', 'Hello')
+            assert dash_in_process.get_prop('out', 'children') == 'Hello'
+
+    .. seealso:: :py:class:`pytest_dash.in_process.DashInProcess`
+    """
+    from pytest_dash.in_process import DashInProcess
+
+    with DashInProcess() as starter:
+        yield starter
+
+
+@pytest.fixture
+def dash_load():
+    """
+    Post callback payloads concurrently to a running dash application
+    and collect the throughput and latencies.
+
+    :Example:
+
+    .. code-block:: python
+
+        def test_load(dash_threaded, dash_load):
+            dash_threaded(app, port='auto', backend='waitress')
+            payload = dash_load.payload(
+                dash_threaded, 'out.children', {'value.value': 'Hello'}
+            )
+            result = dash_load(dash_threaded, [payload], repeat=100)
+            result.assert_no_errors()
+            result.assert_latency(p95=0.2, p99=0.5)
+
+    .. seealso:: :py:class:`pytest_dash.load.DashLoad`
+    """
+    from pytest_dash.load import DashLoad
+
+    return DashLoad()
+
+
+@pytest.fixture(scope='module')
+def dash_threaded_module():
+    """
+    Module scoped :py:func:`dash_threaded`, the server is kept alive
+    between the tests of the module.
+
+    Starting the same app with the same server arguments again only
+    reloads the page, use ``dash_threaded_module.reset()`` to set a new
+    layout or call the ``reset_hooks`` that clear the server side state.
+
+    :Example:
+
+    .. code-block:: python
+
+        from pytest_dash.application_runners import import_app
+
+        app = import_app('my_app')
+
+        def test_first(dash_threaded_module):
+            dash_threaded_module(app, port='auto')
+
+        def test_second(dash_threaded_module):
+            # Same app, the server is not restarted.
+            dash_threaded_module(app, port='auto')
+            dash_threaded_module.reset(layout=html.Div('New layout'))
+
+    .. seealso:: :py:meth:`pytest_dash.application_runners.DashThreaded.reset`
+    """
+    from pytest_dash.application_runners import DashThreaded
+
+    with _plugin.driver_pool.driver() as driver, DashThreaded(
+            driver, **_plugin.settings['threaded']) as starter:
+        yield starter
+
+
+@pytest.fixture(scope='session')
+def dash_threaded_session():
+    """
+    Session scoped :py:func:`dash_threaded`, the server is kept alive
+    for all the tests using the fixture.
+
+    .. seealso:: :py:func:`dash_threaded_module`
+    """
+    from pytest_dash.application_runners import DashThreaded
+
+    with _plugin.driver_pool.driver() as driver, DashThreaded(
+            driver, **_plugin.settings['threaded']) as starter:
         yield starter
@@ -0,0 +1,216 @@
+"""
+Javascript snippets executed in the browser by the waits.
+
+Each snippet reads everything a poll needs in a single ``execute_script``
+call instead of one webdriver command per element and property.
+"""
+
+# Text, property or computed style of an element.
+_element_value = '''
+function elementValue(element, kind, name) {
+    var value = null;
+    switch (kind) {
+        case 'text':
+            // SVG elements have no innerText.
+            value = element.innerText === undefined ?
+                element.textContent : element.innerText;
+            value = (value || '').trim();
+            break;
+        case 'prop':
+            value = element[name];
+            if (value !== null && typeof value === 'object') {
+                try {
+                    value = JSON.parse(JSON.stringify(value));
+                } catch (e) {
+                    value = String(value);
+                }
+            }
+            break;
+        case 'style':
+            value = window.getComputedStyle(element).getPropertyValue(name);
+            break;
+    }
+    return value === undefined ? null : value;
+}
+'''
+
+# Evaluate a list of conditions specs ``{kind, by, selector, name,
+# multiple}``, return ``{found, value}`` for every condition.
+# The elements are returned as values of the ``selector`` conditions.
+_evaluate = '''
+function findElements(spec) {
+    var found = [];
+    if (spec.by === 'xpath') {
+        var snapshot = document.evaluate(
+            spec.selector, document, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        for (var i = 0; i < snapshot.snapshotLength; i++) {
+            found.push(snapshot.snapshotItem(i));
+        }
+    } else if (spec.by === 'id') {
+        var element = document.getElementById(spec.selector);
+        if (element) {
+            found.push(element);
+        }
+    } else if (spec.multiple) {
+        found = Array.prototype.slice.call(
+            document.querySelectorAll(spec.selector)
+        );
+    } else {
+        var first = document.querySelector(spec.selector);
+        if (first) {
+            found.push(first);
+        }
+    }
+    return found;
+}
+
+function evaluate(specs) {
+    return specs.map(function (spec) {
+        var found = findElements(spec);
+        if (!found.length) {
+            return {found: false, value: null};
+        }
+        if (spec.multiple) {
+            return {found: true, value: found, count: found.length};
+        }
+        var element = found[0];
+        return {
+            found: true,
+            value: spec.kind === 'selector' ?
+                element : elementValue(element, spec.kind, spec.name)
+        };
+    });
+}
+
+function signature(results) {
+    // The results without the elements, to detect the changes.
+    return JSON.stringify(results.map(function (result) {
+        var value = result.value;
+        if (value && (value.nodeType || Array.isArray(value))) {
+            value = null;
+        }
+        return [result.found, result.count, value];
+    }));
+}
+'''
+
+# Value ``(element, kind, name)`` of an element.
+element_value = _element_value + '''
+return elementValue(arguments[0], arguments[1], arguments[2]);
+'''
+
+evaluate_conditions = _element_value + _evaluate + '''
+return evaluate(arguments[0]);
+'''
+
+# Async script returning ``{results, signature}`` as soon as the results
+# differ from the ``previous`` signature, checked on every DOM mutation,
+# or after ``timeout`` milliseconds.
+observe_conditions = _element_value + _evaluate + '''
+var specs = arguments[0];
+var previous = arguments[1];
+var timeout = arguments[2];
+var done = arguments[arguments.length - 1];
+var observer = null;
+var timer = null;
+var finished = false;
+
+function finish(results) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    if (observer) {
+        observer.disconnect();
+    }
+    clearTimeout(timer);
+    done({results: results, signature: signature(results)});
+}
+
+function check() {
+    var results = evaluate(specs);
+    if (signature(results) !== previous) {
+        finish(results);
+    }
+}
+
+check();
+if (!finished) {
+    observer = new MutationObserver(check);
+    observer.observe(document.documentElement, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        characterData: true
+    });
+    timer = setTimeout(function () {
+        finish(evaluate(specs));
+    }, timeout);
+}
+'''
+
+# Count the pending ``_dash-update-component`` requests made with fetch or
+# XMLHttpRequest, the counter is installed on the first call.
+# Return ``{pending, total, idle, loading}``, ``idle`` is the time in
+# milliseconds since the last callback request started or ended and
+# ``loading`` the number of components marked as loading by the renderer.
+callbacks_state = '''
+if (!window.__pytestDashCallbacks) {
+    var state = window.__pytestDashCallbacks = {
+        pending: 0,
+        total: 0,
+        last: Date.now()
+    };
+    var isCallback = function (url) {
+        return String(url).indexOf('_dash-update-component') !== -1;
+    };
+    var start = function () {
+        state.pending++;
+        state.total++;
+        state.last = Date.now();
+    };
+    var end = function () {
+        state.pending--;
+        state.last = Date.now();
+    };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function (input) {
+            var url = input && input.url ? input.url : input;
+            if (!isCallback(url)) {
+                return fetch.apply(this, arguments);
+            }
+            start();
+            return fetch.apply(this, arguments).then(function (response) {
+                end();
+                return response;
+            }, function (error) {
+                end();
+                throw error;
+            });
+        };
+    }
+    var open = XMLHttpRequest.prototype.open;
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__pytestDashCallback = isCallback(url);
+        return open.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function () {
+        if (this.__pytestDashCallback) {
+            start();
+            this.addEventListener('loadend', end);
+        }
+        return send.apply(this, arguments);
+    };
+}
+var current = window.__pytestDashCallbacks;
+return {
+    pending: current.pending,
+    total: current.total,
+    idle: Date.now() - current.last,
+    loading: document.querySelectorAll('[data-dash-is-loading="true"]').length
+};
+'''
@@ -0,0 +1,154 @@
+"""
+WSGI server backends to run dash applications in a thread.
+
+Each backend serve the application with ``serve_forever`` in the runner
+thread and can be stopped from another thread with ``shutdown``.
+"""
+from six.moves import socketserver
+
+from pytest_dash.errors import InvalidServerBackendError
+
+# socketserver check for shutdown at this interval, default is 0.5s.
+_poll_interval = 0.01
+
+
+class WerkzeugServer(object):
+    """Werkzeug development server, a new thread for every request."""
+
+    # pylint: disable=unused-argument
+    def __init__(self, app, host, port, threads=4):
+        from werkzeug.serving import make_server
+        self.server = make_server(host, port, app, threaded=True)
+
+    def serve_forever(self):
+        """
+        Serve until :py:meth:`shutdown` is called.
+
+        :return:
+        """
+        # The werkzeug serve_forever doesn't take a poll interval
+        # on older versions, call the socketserver loop directly.
+        self.server.shutdown_signal = False
+        socketserver.BaseServer.serve_forever(
+            self.server, poll_interval=_poll_interval
+        )
+
+    def shutdown(self):
+        """
+        Stop serving and close the socket.
+
+        :return:
+        """
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class WaitressServer(object):
+    """Waitress server with a pool of worker threads."""
+
+    def __init__(self, app, host, port, threads=4):
+        from waitress.server import create_server as create_waitress
+        self.server = create_waitress(
+            app, host=host, port=port, threads=threads
+        )
+
+    def serve_forever(self):
+        """
+        Run the waitress loop until :py:meth:`shutdown` is called.
+
+        :return:
+        """
+        self.server.run()
+
+    def shutdown(self):
+        """
+        Close the channels to exit the loop and stop the worker threads.
+
+        :return:
+        """
+
+        # pylint: disable=protected-access
+        def close():
+            # The loop exits once all the channels are closed.
+            for channel in list(self.server._map.values()):
+                channel.close()
+
+        # Run the close in the loop thread to wake it up immediately.
+        self.server.trigger.pull_trigger(close)
+        self.server.task_dispatcher.shutdown()
+
+
+class WsgirefServer(object):
+    """Standard library wsgiref server, a new thread for every request."""
+
+    # pylint: disable=unused-argument
+    def __init__(self, app, host, port, threads=4):
+        from wsgiref.simple_server import (
+            make_server, WSGIServer, WSGIRequestHandler
+        )
+
+        class _ThreadingServer(socketserver.ThreadingMixIn, WSGIServer):
+            daemon_threads = True
+
+        class _QuietHandler(WSGIRequestHandler):
+            # pylint: disable=arguments-differ
+            def log_message(self, *args):
+                pass
+
+        self.server = make_server(
+            host,
+            port,
+            app,
+            server_class=_ThreadingServer,
+            handler_class=_QuietHandler
+        )
+
+    def serve_forever(self):
+        """
+        Serve until :py:meth:`shutdown` is called.
+
+        :return:
+        """
+        self.server.serve_forever(poll_interval=_poll_interval)
+
+    def shutdown(self):
+        """
+        Stop serving and close the socket.
+
+        :return:
+        """
+        self.server.shutdown()
+        self.server.server_close()
+
+
+_server_backends = {
+    'werkzeug': WerkzeugServer,
+    'waitress': WaitressServer,
+    'wsgiref': WsgirefServer,
+}
+
+
+def create_server(backend, app, host, port, threads=4):
+    """
+    Create a server for a wsgi application, the socket is bound when
+    the server is created.
+
+    :param backend: Name of the server backend
+        (``werkzeug``, ``waitress`` or ``wsgiref``).
+    :type backend: str
+    :param app: The wsgi application (eg: ``dash_app.server``).
+    :param host: Interface to listen.
+    :type host: str
+    :param port: Port to listen.
+    :type port: int
+    :param threads: Number of worker threads (waitress).
+    :type threads: int
+    :raise: pytest_dash.errors.InvalidServerBackendError
+    :return: The server, call ``serve_forever`` to start serving.
+    """
+    if backend not in _server_backends:
+        raise InvalidServerBackendError(
+            '{} is not a valid server backend.\n'
+            'Valid backends {}'.format(backend, list(_server_backends))
+        )
+    return _server_backends[backend](app, host, port, threads=threads)
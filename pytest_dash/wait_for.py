@@ -1,20 +1,162 @@
 """Utils methods for pytest-dash such wait_for wrappers"""
 import pprint
+import socket
 import time
+import weakref
 
-from selenium.common.exceptions import TimeoutException
+import requests
+from six.moves.urllib.parse import urlparse
+
+from selenium.common.exceptions import (
+    JavascriptException, NoSuchElementException,
+    StaleElementReferenceException, TimeoutException, WebDriverException
+)
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.select import By
 
+from pytest_dash import scripts
+from pytest_dash.conditions import (
+    element_present, elements_present, text_to_equal, property_to_equal,
+    style_to_equal, _normalize_style
+)
+from pytest_dash.drivers import drain_console_logs
 from pytest_dash.errors import DashAppLoadingError
+from pytest_dash.wait_report import wait_recorder
+
+
+class _WaitSettings(object):  # pylint: disable=too-few-public-methods
+    # Global settings of the waits, set from the plugin options.
+    def __init__(self):
+        # `poll` or `observer`.
+        self.mode = 'poll'
+        # Default timeout of the waits.
+        self.timeout = 10
+        # Time between two polls, also the maximum time of an async
+        # observer script before the conditions are evaluated again.
+        self.poll_frequency = 0.5
+        # Poll fast first and double the delay up to the poll frequency.
+        self.backoff = False
+        # Time budget in seconds of the current test and the time it ends,
+        # the waits timeouts are capped to the remaining time.
+        self.budget = None
+        self.deadline = None
+
 
+_settings = _WaitSettings()
 
-def _wait_for(driver, condition, timeout=10.0):
-    return WebDriverWait(driver, timeout).until(condition)
+_by_names = {
+    By.CSS_SELECTOR: 'css',
+    By.XPATH: 'xpath',
+    By.ID: 'id',
+}
 
+# First delay of the adaptive backoff polling.
+_backoff_start = 0.01
 
-def _wait_for_element(driver, by, accessor, timeout=10.0):
+
+def _resolve_timeout(timeout):
+    timeout = _settings.timeout if timeout is None else timeout
+    if _settings.deadline is not None:
+        timeout = max(min(timeout, _settings.deadline - time.time()), 0)
+    return timeout
+
+
+def set_time_budget(budget):
+    """
+    Set the time budget of the current test, every wait and the
+    application start use the remaining time as their maximum timeout, so
+    a broken app fails at once instead of waiting for every timeout.
+
+    The plugin sets it before every test from the ``dash_timeout`` marker,
+    the ``timeout`` of a yaml behavior or the ``dash_test_timeout`` option.
+
+    :param budget: Time in seconds from now, None to remove the budget.
+    :type budget: float
+    :return:
+    """
+    _settings.budget = budget
+    _settings.deadline = None if budget is None else time.time() + budget
+
+
+def _budget_message(message):
+    # Explain a timeout caused by the exhausted time budget.
+    if _settings.deadline is None or time.time() < _settings.deadline:
+        return message
+    return '{}\nDash test time budget of {}s exceeded.'.format(
+        message or 'Timed out.', _settings.budget
+    )
+
+
+def _poll_with_backoff(driver, condition, timeout):
+    # Same as WebDriverWait.until with a doubling delay between the polls.
+    end_time = time.time() + timeout
+    delay = min(_backoff_start, _settings.poll_frequency)
+    while True:
+        try:
+            value = condition(driver)
+            if value:
+                return value
+        except NoSuchElementException:
+            pass
+        remaining = end_time - time.time()
+        if remaining <= 0:
+            raise TimeoutException()
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, _settings.poll_frequency)
+
+
+def _describe(condition):
+    # Readable description of a wait condition for the records.
+    description = getattr(condition, 'description', None)
+    if description:
+        return description
+    name = getattr(condition, '__name__', None) or \
+        type(condition).__name__
+    locator = getattr(condition, 'locator', None)
+    if locator:
+        return '{} {}={}'.format(name, _by_names.get(locator[0]), locator[1])
+    return name
+
+
+def _wait_for(driver, condition, timeout=None):
+    timeout = _resolve_timeout(timeout)
+    record = wait_recorder.start(
+        _describe(condition), timeout, _settings.budget
+    )
+    polls = [0]
+
+    def counted(d):
+        polls[0] += 1
+        return condition(d)
+
+    timed_out = False
+    try:
+        if _settings.backoff:
+            return _poll_with_backoff(driver, counted, timeout)
+        return WebDriverWait(
+            driver, timeout, poll_frequency=_settings.poll_frequency
+        ).until(counted)
+    except TimeoutException as err:
+        timed_out = True
+        message = _budget_message(err.msg)
+        if message != err.msg:
+            raise TimeoutException(message)
+        raise
+    finally:
+        if record is not None:
+            record['polls'] = polls[0]
+        wait_recorder.finish(record, timed_out)
+        # Keep the console logs emitted while waiting, throttled.
+        drain_console_logs(driver)
+
+
+def _wait_for_element(driver, by, accessor, timeout=None):
+    if _settings.mode == 'observer':
+        return wait_for_all(
+            driver, [element_present(accessor, by=_by_names[by])],
+            timeout=timeout
+        )[0]
     return _wait_for(
         driver,
         EC.presence_of_element_located((by, accessor)),
@@ -22,7 +164,7 @@ def _wait_for_element(driver, by, accessor, timeout=10.0):
     )
 
 
-def wait_for_element_by_css_selector(driver, selector, timeout=10.0):
+def wait_for_element_by_css_selector(driver, selector, timeout=None):
     """
     Wait until a single element is found and return it.
     This variant use the css selector api:
@@ -32,7 +174,8 @@ def wait_for_element_by_css_selector(driver, selector, timeout=10.0):
     :type driver: selenium.webdriver.remote.webdriver.WebDriver
     :param selector: CSS selector to find.
     :type selector: str
-    :param timeout: Maximum time to find the element.
+    :param timeout: Maximum time to find the element, default to the
+        ``dash_wait_timeout`` option.
     :type timeout: float
     :return:
     """
@@ -41,7 +184,7 @@ def wait_for_element_by_css_selector(driver, selector, timeout=10.0):
     )
 
 
-def wait_for_elements_by_css_selector(driver, selector, timeout=10.0):
+def wait_for_elements_by_css_selector(driver, selector, timeout=None):
     """
     Wait until all elements are found by the selector before the timeout.
 
@@ -49,10 +192,15 @@ def wait_for_elements_by_css_selector(driver, selector, timeout=10.0):
     :type driver: selenium.webdriver.remote.webdriver.WebDriver
     :param selector: Search for elements
     :type selector: str
-    :param timeout: Maximum wait time
+    :param timeout: Maximum wait time, default to the
+        ``dash_wait_timeout`` option.
     :type timeout: float
     :return: Found elements
     """
+    if _settings.mode == 'observer':
+        return wait_for_all(
+            driver, [elements_present(selector)], timeout=timeout
+        )[0]
     return _wait_for(
         driver,
         EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector)),
@@ -60,7 +208,7 @@ def wait_for_elements_by_css_selector(driver, selector, timeout=10.0):
     )
 
 
-def wait_for_element_by_xpath(driver, xpath, timeout=10):
+def wait_for_element_by_xpath(driver, xpath, timeout=None):
     """
     Wait until a single element is found and return it.
     This variant use xpath to find the element.
@@ -70,14 +218,15 @@ def wait_for_element_by_xpath(driver, xpath, timeout=10):
     :type driver: selenium.webdriver.remote.webdriver.WebDriver
     :param xpath: Xpath query string.
     :type xpath: str
-    :param timeout: Maximum time to find the element.
+    :param timeout: Maximum time to find the element, default to the
+        ``dash_wait_timeout`` option.
     :type timeout: float
     :return:
     """
     return _wait_for_element(driver, By.XPATH, xpath, timeout=timeout)
 
 
-def wait_for_elements_by_xpath(driver, xpath, timeout=10):
+def wait_for_elements_by_xpath(driver, xpath, timeout=None):
     """
     Wait until all are found before the timeout.
     This variant use xpath to find the elements.
@@ -87,10 +236,15 @@ def wait_for_elements_by_xpath(driver, xpath, timeout=10):
     :type driver: selenium.webdriver.remote.webdriver.WebDriver
     :param xpath: Xpath query string.
     :type xpath: str
-    :param timeout: Maximum time to find the element.
+    :param timeout: Maximum time to find the element, default to the
+        ``dash_wait_timeout`` option.
     :type timeout: float
     :return:
     """
+    if _settings.mode == 'observer':
+        return wait_for_all(
+            driver, [elements_present(xpath, by='xpath')], timeout=timeout
+        )[0]
     return _wait_for(
         driver,
         EC.presence_of_all_elements_located((By.XPATH, xpath)),
@@ -98,7 +252,7 @@ def wait_for_elements_by_xpath(driver, xpath, timeout=10):
     )
 
 
-def wait_for_element_by_id(driver, _id, timeout=10):
+def wait_for_element_by_id(driver, _id, timeout=None):
     """
     Wait until a single element is found and return it.
     This variant find by id.
@@ -106,14 +260,15 @@ def wait_for_element_by_id(driver, _id, timeout=10):
     :param driver: Selenium driver
     :type driver: selenium.webdriver.remote.webdriver.WebDriver
     :param _id: The id of the element to find.
-    :param timeout: Maximum time to find the element.
+    :param timeout: Maximum time to find the element, default to the
+        ``dash_wait_timeout`` option.
     :type timeout: float
     :return:
     """
     return _wait_for_element(driver, By.ID, _id, timeout=timeout)
 
 
-def wait_for_text_to_equal(driver, selector, text, timeout=10):
+def wait_for_text_to_equal(driver, selector, text, timeout=None):
     """
     Wait an element text found by css selector is equal to text.
 
@@ -123,19 +278,16 @@ def wait_for_text_to_equal(driver, selector, text, timeout=10):
     :type selector: str
     :param text: Text to equal.
     :type text: str
-    :param timeout: Maximum time for the text to equal.
+    :param timeout: Maximum time for the text to equal, default to the
+        ``dash_wait_timeout`` option.
     :type timeout: float
     :return:
     """
-
-    def condition(d):
-        return text == d.find_element_by_css_selector(selector).text
-
-    _wait_for(driver, condition, timeout=timeout)
+    wait_for_all(driver, [text_to_equal(selector, text)], timeout=timeout)
 
 
 def wait_for_style_to_equal(
-        driver, selector, style_attribute, style_assertion, timeout=10
+        driver, selector, style_attribute, style_assertion, timeout=None
 ):
     """
     Wait for an element style attribute to equal.
@@ -148,20 +300,19 @@ def wait_for_style_to_equal(
     :type style_attribute: str
     :param style_assertion: The value to equal of CSS attribute.
     :type style_assertion: str
-    :param timeout: Maximum time.
+    :param timeout: Maximum time, default to the
+        ``dash_wait_timeout`` option.
     :type timeout: float
     :return:
     """
-
-    def condition(d):
-        return style_assertion == d.find_element_by_css_selector(selector)\
-            .value_of_css_property(style_attribute)
-
-    _wait_for(driver, condition, timeout=timeout)
+    wait_for_all(
+        driver, [style_to_equal(selector, style_attribute, style_assertion)],
+        timeout=timeout
+    )
 
 
 def wait_for_property_to_equal(
-        driver, selector, prop_name, prop_value, timeout=10
+        driver, selector, prop_name, prop_value, timeout=None
 ):
     """
     Wait for an element property to equal a value.
@@ -173,21 +324,370 @@ def wait_for_property_to_equal(
     :param prop_name: The name of property.
     :type prop_name: str
     :param prop_value: The value to assert.
-    :param timeout: Maximum time.
+    :param timeout: Maximum time, default to the
+        ``dash_wait_timeout`` option.
     :type timeout: float
     :return:
     """
+    wait_for_all(
+        driver, [property_to_equal(selector, prop_name, prop_value)],
+        timeout=timeout
+    )
+
+
+def _element_value(driver, element, kind, name=None):
+    """
+    Read the text, property or style of an element with a single script.
+
+    :param driver: Selenium driver
+    :type driver: selenium.webdriver.remote.webdriver.WebDriver
+    :param element: The element to read.
+    :type element: selenium.webdriver.remote.webelement.WebElement
+    :param kind: ``text``, ``prop`` or ``style``.
+    :type kind: str
+    :param name: Name of the property or style attribute.
+    :type name: str
+    :raise: selenium.common.exceptions.StaleElementReferenceException
+    :return: The value, styles colors are normalized to ``rgba``.
+    """
+    value = driver.execute_script(scripts.element_value, element, kind, name)
+    if kind == 'style':
+        return _normalize_style(value)
+    return value
+
+
+def _element_condition(element, kind, check, name=None):
+    # Wait condition on the value of an element, a stale element is
+    # considered not ready yet.
+    def condition(d):
+        try:
+            return check(_element_value(d, element, kind, name))
+        except StaleElementReferenceException:
+            # Cached elements can be found again from their locator.
+            refresh = getattr(element, 'refresh', None)
+            if refresh:
+                refresh()
+            return False
+
+    locator = getattr(element, 'locator', None)
+    condition.description = '{} of {}'.format(
+        ' '.join(x for x in (kind, name) if x),
+        '{}={}'.format(*locator) if locator else 'element'
+    )
+    return condition
+
+
+# Drivers without async scripts support, polled in the observer mode.
+_polled_drivers = weakref.WeakKeyDictionary()
+
+
+def _session_script_timeout(driver):
+    # Selenium can't read the script timeout back, use the one of the
+    # session capabilities or the webdriver default.
+    capabilities = getattr(driver, 'capabilities', None) or {}
+    script = (capabilities.get('timeouts') or {}).get('script')
+    return script / 1000.0 if script is not None else 30
+
+
+def _observe_conditions(driver, conditions, check, timeout, polls):
+    # Wait with a MutationObserver in an async script, the script returns
+    # as soon as the evaluated conditions change.
+    specs = [x.spec for x in conditions]
+    interval = _settings.poll_frequency
+    end_time = time.time() + timeout
+    previous = None
+
+    driver.set_script_timeout(interval + 5)
+    try:
+        while True:
+            remaining = max(end_time - time.time(), 0)
+            response = driver.execute_async_script(
+                scripts.observe_conditions, specs, previous,
+                int(min(remaining, interval) * 1000)
+            )
+            polls[0] += 1
+            previous = response['signature']
+            results = [
+                c.check(r) for c, r in zip(conditions, response['results'])
+            ]
+            if check(results):
+                return True
+            if time.time() >= end_time:
+                raise TimeoutException()
+    finally:
+        driver.set_script_timeout(_session_script_timeout(driver))
+
+
+def _wait_for_conditions(driver, conditions, check, timeout):
+    timeout = _resolve_timeout(timeout)
+    specs = [x.spec for x in conditions]
+    start_time = time.time()
+    record = wait_recorder.start(
+        ', '.join(x.description for x in conditions), timeout, _settings.budget
+    )
+    polls = [0]
 
     def condition(d):
-        return prop_value == d.find_element_by_css_selector(selector)\
-            .get_property(prop_name)
+        polls[0] += 1
+        results = d.execute_script(scripts.evaluate_conditions, specs)
+        return check([c.check(r) for c, r in zip(conditions, results)])
+
+    timed_out = False
+    try:
+        if _settings.mode == 'observer' and driver not in _polled_drivers:
+            try:
+                return _observe_conditions(
+                    driver, conditions, check, timeout, polls
+                )
+            except WebDriverException as err:
+                if isinstance(err, TimeoutException):
+                    raise
+                if not isinstance(err, JavascriptException):
+                    # No async scripts support, always poll this driver.
+                    _polled_drivers[driver] = True
+                # Poll for the remaining time, also when the page navigated.
+                timeout = max(timeout - (time.time() - start_time), 0)
+            finally:
+                drain_console_logs(driver)
+        return _wait_for(driver, condition, timeout=timeout)
+    except TimeoutException:
+        timed_out = True
+        raise TimeoutException(
+            _budget_message(
+                'Conditions not met after {}s:\n{}'.format(
+                    timeout, '\n'.join(str(x) for x in conditions)
+                )
+            )
+        )
+    finally:
+        if record is not None:
+            record['polls'] = polls[0]
+        wait_recorder.finish(record, timed_out)
+
 
-    _wait_for(driver, condition, timeout=timeout)
+def wait_for_all(driver, conditions, timeout=None):
+    """
+    Wait until all the conditions hold, the conditions are evaluated
+    together with a single script call per poll.
 
+    :Example:
 
-def _wait_for_client_app_started(driver, url, wait_time=0.5, timeout=10):
+        >>> wait_for_all(driver, [
+        ...     text_to_equal('#out', 'Hello'),
+        ...     property_to_equal('#input', 'value', 'Hello'),
+        ...     style_to_equal('#out', 'color', 'rgba(255, 0, 0, 1)'),
+        ... ])
+
+    :param driver: Selenium driver
+    :type driver: selenium.webdriver.remote.webdriver.WebDriver
+    :param conditions: Conditions to wait for.
+    :type conditions: list[pytest_dash.conditions.Condition]
+    :param timeout: Maximum time for all the conditions to hold, default to the
+        ``dash_wait_timeout`` option.
+    :type timeout: float
+    :raise: selenium.common.exceptions.TimeoutException
+    :return: The values of the conditions.
+    :rtype: list
+    """
+    _wait_for_conditions(driver, conditions, all, timeout)
+    return [x.value for x in conditions]
+
+
+def wait_for_any(driver, conditions, timeout=None):
+    """
+    Wait until one of the conditions hold, the conditions are evaluated
+    together with a single script call per poll.
+
+    :param driver: Selenium driver
+    :type driver: selenium.webdriver.remote.webdriver.WebDriver
+    :param conditions: Conditions to wait for.
+    :type conditions: list[pytest_dash.conditions.Condition]
+    :param timeout: Maximum time for a condition to hold, default to the
+        ``dash_wait_timeout`` option.
+    :type timeout: float
+    :raise: selenium.common.exceptions.TimeoutException
+    :return: The first condition that holds.
+    :rtype: pytest_dash.conditions.Condition
+    """
+    matched = []
+
+    def check(results):
+        matched[:] = [c for c, ok in zip(conditions, results) if ok]
+        return bool(matched)
+
+    _wait_for_conditions(driver, conditions, check, timeout)
+    return matched[0]
+
+
+def install_callbacks_counter(driver):
+    """
+    Install the callbacks requests counter in the page, the application
+    runners install it once the app is loaded.
+
+    :param driver: Selenium driver
+    :type driver: selenium.webdriver.remote.webdriver.WebDriver
+    :return: The state of the callbacks ``{pending, total, idle, loading}``.
+    :rtype: dict
+    """
+    return driver.execute_script(scripts.callbacks_state)
+
+
+def wait_for_callbacks_idle(driver, quiet_period=0.1, timeout=None):
+    """
+    Wait until dash has no pending callback request and no component is
+    loading for ``quiet_period`` seconds.
+
+    The ``_dash-update-component`` requests are counted by wrapping
+    ``fetch`` and ``XMLHttpRequest`` in the page, the requests started
+    before the counter is installed are not counted.
+
+    :Example:
+
+        >>> wait_for_element_by_id(driver, 'button').click()
+        >>> wait_for_callbacks_idle(driver)
+        >>> assert driver.find_element_by_id('output').text == 'clicked'
+
+    :param driver: Selenium driver
+    :type driver: selenium.webdriver.remote.webdriver.WebDriver
+    :param quiet_period: Time without callback requests to consider the
+        app idle, the chained callbacks start right after a response.
+    :type quiet_period: float
+    :param timeout: Maximum time, default to the
+        ``dash_wait_timeout`` option.
+    :type timeout: float
+    :raise: selenium.common.exceptions.TimeoutException
+    :return: Number of callback requests counted since the counter was
+        installed.
+    :rtype: int
+    """
+    state = {}
+
+    def condition(d):
+        state.update(install_callbacks_counter(d))
+        return state['pending'] <= 0 and not state['loading'] \
+            and state['idle'] >= quiet_period * 1000
+
+    condition.description = 'dash callbacks idle'
+    timeout = _resolve_timeout(timeout)
+    try:
+        _wait_for(driver, condition, timeout=timeout)
+    except TimeoutException:
+        raise TimeoutException(
+            _budget_message(
+                'Dash callbacks still running after {}s: {}'.format(
+                    timeout, state
+                )
+            )
+        )
+    return state['total']
+
+
+def _probe_backoff(start_time, timeout, delay, url):
+    # Sleep before the next server probe, doubling the delay up to 50ms.
+    if time.time() - start_time > timeout:
+        raise DashAppLoadingError(
+            'Dash server {} did not respond after {}'.format(url, timeout)
+        )
+    time.sleep(delay)
+    return min(delay * 2, 0.05)
+
+
+def _wait_for_server_ready(url, timeout=10, check_alive=None):
+    # Wait until the socket accept connections and the dash endpoints
+    # respond without loading the page in the browser.
+    # `check_alive` is called before every retry to fail at once when the
+    # server process exited, it raises a DashAppLoadingError.
+    start_time = time.time()
+    parsed = urlparse(url)
+    address = (parsed.hostname, parsed.port or 80)
+    delay = 0.005
+
+    while True:
+        try:
+            socket.create_connection(address, timeout=1).close()
+            break
+        except socket.error:
+            if check_alive is not None:
+                check_alive()
+            delay = _probe_backoff(start_time, timeout, delay, url)
+
+    with requests.Session() as session:
+        for endpoint in ('_dash-layout', '_dash-dependencies'):
+            endpoint_url = '{}/{}'.format(url.rstrip('/'), endpoint)
+            while True:
+                try:
+                    response = session.get(endpoint_url, timeout=timeout)
+                except requests.ConnectionError:
+                    if check_alive is not None:
+                        check_alive()
+                    delay = _probe_backoff(start_time, timeout, delay, url)
+                    continue
+                if response.status_code >= 500:
+                    raise DashAppLoadingError(
+                        'Dash server error on {}: {}\n\n{}'.format(
+                            endpoint, response.status_code, response.text
+                        )
+                    )
+                # Other status (eg: 404 with a custom url prefix) are left
+                # for the browser to handle.
+                break
+
+
+def _wait_for_server_closed(url, timeout=1):
+    # Wait until the server socket refuse connections,
+    # return False if it's still open after the timeout.
+    start_time = time.time()
+    parsed = urlparse(url)
+    address = (parsed.hostname, parsed.port or 80)
+    delay = 0.005
+
+    while True:
+        try:
+            socket.create_connection(address, timeout=timeout).close()
+        except socket.error:
+            return True
+        if time.time() - start_time > timeout:
+            return False
+        time.sleep(delay)
+        delay = min(delay * 2, 0.05)
+
+
+def _wait_for_client_app_started(
+        driver, url, wait_time=None, timeout=None, check_alive=None
+):
     # Wait until the #_dash-app-content element is loaded.
     start_time = time.time()
+    timeout = _resolve_timeout(timeout)
+    if wait_time is None:
+        wait_time = _settings.poll_frequency
+    if timeout <= 0:
+        raise DashAppLoadingError(
+            _budget_message('Dash app {} not started.'.format(url))
+        )
+    record = wait_recorder.start(
+        'dash app {}'.format(url), timeout, _settings.budget
+    )
+    polls = [0]
+    timed_out = False
+    try:
+        _wait_for_server_ready(url, timeout=timeout, check_alive=check_alive)
+        _wait_for_app_content(
+            driver, url, wait_time, timeout, start_time, polls
+        )
+    except TimeoutException:
+        timed_out = True
+        raise
+    except DashAppLoadingError:
+        # The server errors and crashes fail before the timeout.
+        timed_out = time.time() - start_time > timeout
+        raise
+    finally:
+        if record is not None:
+            record['polls'] = polls[0]
+        wait_recorder.finish(record, timed_out)
+
+
+def _wait_for_app_content(driver, url, wait_time, timeout, start_time, polls):
     loading_errors = (
         'Error loading layout',
         'Error loading dependencies',
@@ -195,21 +695,29 @@ def _wait_for_client_app_started(driver, url, wait_time=0.5, timeout=10):
     )
     while True:
         try:
+            polls[0] += 1
             driver.get(url)
             wait_for_element_by_css_selector(
                 driver, '#_dash-app-content', timeout=wait_time
             )
+            install_callbacks_counter(driver)
             return
         except TimeoutException:
             body = wait_for_element_by_css_selector(driver, 'body')
             if any(x in body.text for x in loading_errors) \
                     or time.time() - start_time > timeout:
 
-                logs = driver.get_log('browser')
+                collector = drain_console_logs(driver, force=True)
+                if collector is not None:
+                    logs = collector.entries(start_time)
+                else:
+                    logs = driver.get_log('browser')
                 raise DashAppLoadingError(
-                    'Dash could not start after {}:'
-                    ' \nHTML:\n {}\n\nLOGS: {}'.format(
-                        timeout, body.get_property('innerHTML'),
-                        pprint.pformat(logs)
+                    _budget_message(
+                        'Dash could not start after {}:'
+                        ' \nHTML:\n {}\n\nLOGS: {}'.format(
+                            timeout, body.get_property('innerHTML'),
+                            pprint.pformat(logs)
+                        )
                     )
                 )
@@ -0,0 +1,192 @@
+"""
+Record the duration of the waits for the slowest waits terminal summary
+and the json report.
+"""
+import collections
+import io
+import json
+import os
+import threading
+import time
+
+import six
+
+
+class WaitRecorder(object):
+    """
+    Record the duration of the waits, enabled by the ``dash_wait_summary``
+    and ``dash_wait_report`` options.
+
+    Only the outermost wait of a thread is recorded, the waits made while
+    waiting (eg: the elements found again) are part of it.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.records = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @staticmethod
+    def _current_test():
+        # Set by pytest as `nodeid (phase)` while a test runs.
+        current = os.environ.get('PYTEST_CURRENT_TEST')
+        return current.rsplit(' ', 1)[0] if current else None
+
+    def start(self, description, timeout, budget=None):
+        """
+        :param description: The locator or condition waited for.
+        :type description: str
+        :param timeout: Timeout of the wait.
+        :type timeout: float
+        :param budget: Time budget of the test.
+        :type budget: float
+        :return: The record to finish, None for the nested waits or if
+            the recorder is disabled.
+        :rtype: dict
+        """
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
+        if depth or not self.enabled:
+            return None
+        return {
+            'nodeid': self._current_test(),
+            'condition': description,
+            'start': time.time(),
+            'duration': None,
+            'polls': 0,
+            'timeout': timeout,
+            'budget': budget,
+            'timed_out': False,
+        }
+
+    def finish(self, record, timed_out):
+        """
+        Set the duration of a record from :py:meth:`start` and keep it.
+
+        :param record: The record to finish.
+        :type record: dict
+        :param timed_out: The wait timed out.
+        :type timed_out: bool
+        :return:
+        """
+        self._local.depth -= 1
+        if record is None:
+            return
+        record['duration'] = time.time() - record['start']
+        record['timed_out'] = timed_out
+        with self._lock:
+            self.records.append(record)
+
+    def slowest(self, count):
+        """
+        :param count: Number of records.
+        :type count: int
+        :return: The longest waits, slowest first.
+        :rtype: list
+        """
+        return sorted(self.records, key=lambda x: -x['duration'])[:count]
+
+    def closest_to_timeout(self, count):
+        """
+        The waits of a test are added up against its time budget. A test
+        without a budget has no overall timeout, it's ranked by its wait
+        closest to its own timeout. The tests with a timed out wait already
+        failed and are left out.
+
+        :param count: Number of tests.
+        :type count: int
+        :return: ``{nodeid, waits, duration, timeout, budget}`` of the tests
+            with the highest fraction of their timeout used, closest first.
+        :rtype: list
+        """
+        tests = collections.OrderedDict()
+        for record in self.records:
+            tests.setdefault(record['nodeid'], []).append(record)
+
+        closest = []
+        for nodeid, records in tests.items():
+            if any(x['timed_out'] for x in records):
+                continue
+            budget = records[0].get('budget')
+            if budget:
+                duration = sum(x['duration'] for x in records)
+                timeout = budget
+            else:
+                waits = [x for x in records if x['timeout']]
+                if not waits:
+                    continue
+                wait = max(waits, key=lambda x: x['duration'] / x['timeout'])
+                duration, timeout = wait['duration'], wait['timeout']
+            closest.append({
+                'nodeid': nodeid,
+                'waits': len(records),
+                'duration': duration,
+                'timeout': timeout,
+                'budget': bool(budget),
+            })
+        return sorted(
+            closest, key=lambda x: -x['duration'] / x['timeout']
+        )[:count]
+
+    def summary(self, count=10):
+        """
+        :param count: Number of waits and tests to list in each section.
+        :type count: int
+        :return: Formatted summary of the slowest waits and the tests
+            closest to their timeout.
+        :rtype: str
+        """
+        lines = [
+            '{} waits, {:.3f}s total, {} timed out'.format(
+                len(self.records), sum(x['duration'] for x in self.records),
+                sum(1 for x in self.records if x['timed_out'])
+            ),
+            'Slowest waits:',
+        ]
+        for record in self.slowest(count):
+            lines.append(
+                '  {:8.3f}s {:>5} polls {:>9} {} ({})'.format(
+                    record['duration'], record['polls'],
+                    'TIMEOUT' if record['timed_out'] else '',
+                    record['condition'], record['nodeid']
+                )
+            )
+        closest = self.closest_to_timeout(count)
+        if closest:
+            lines.append('Tests closest to their timeout:')
+        for test in closest:
+            lines.append(
+                '  {:8.3f}s {:>5} waits {:.0%} of the {}s {} ({})'.format(
+                    test['duration'], test['waits'],
+                    test['duration'] / test['timeout'], test['timeout'],
+                    'budget' if test['budget'] else 'wait timeout',
+                    test['nodeid']
+                )
+            )
+        return '\n'.join(lines)
+
+    def dump(self, path):
+        """
+        Write the records to a json file.
+
+        :param path: Path of the file.
+        :type path: str
+        :return:
+        """
+        with io.open(path, 'w', encoding='utf-8') as f:
+            f.write(
+                six.text_type(json.dumps({'waits': self.records}, indent=2))
+            )
+
+    def clear(self):
+        """
+        Remove all the records.
+
+        :return:
+        """
+        with self._lock:
+            self.records = []
+
+
+wait_recorder = WaitRecorder()
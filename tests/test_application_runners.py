@@ -0,0 +1,216 @@
+# pylint: disable=missing-docstring, too-few-public-methods, protected-access
+import socket
+import threading
+import time
+
+import pytest
+
+from pytest_dash import application_runners
+from pytest_dash.errors import (
+    DashAppLoadingError, PortAllocationError, ServerNotStartedError
+)
+from pytest_dash.application_runners import (
+    find_free_port, import_app, DashSubprocessPool
+)
+
+
+def test_find_free_port_in_range(monkeypatch):
+    monkeypatch.setenv('PYTEST_XDIST_WORKER', 'gw1')
+    monkeypatch.setenv('PYTEST_XDIST_WORKER_COUNT', '2')
+
+    port = find_free_port((19000, 19099))
+    assert 19050 <= port <= 19099
+
+
+def test_import_app_cache():
+    app = import_app('test_apps.simple_app', cache=True)
+
+    assert import_app('test_apps.simple_app', cache=True) is app
+    assert import_app('test_apps.simple_app', cache=True, fresh=True) \
+        is not app
+    assert import_app('test_apps.simple_app') is not app
+
+
+def test_import_app_cache_mtime(monkeypatch):
+    # pylint: disable=protected-access
+    cache = application_runners._import_cache
+    mtime = cache._mtime('test_apps.simple_app')
+    assert mtime is not None
+    assert cache._mtime('pytest_dash') is not None
+    app = import_app('test_apps.simple_app', cache=True)
+
+    # The module file changed.
+    monkeypatch.setattr(cache, '_mtime', lambda _: mtime + 1)
+    assert import_app('test_apps.simple_app', cache=True) is not app
+
+
+class _DeadProcess(object):
+    @staticmethod
+    def poll():
+        return 1
+
+
+def test_subprocess_pool_stops_failed_servers(monkeypatch):
+    stopped = []
+
+    def start(self, *_, **__):
+        self.process = _DeadProcess()
+        raise OSError('Probe failed')
+
+    def stop(self):
+        stopped.append(self)
+
+    subprocess_class = application_runners.DashSubprocess
+    monkeypatch.setattr(subprocess_class, 'start', start)
+    monkeypatch.setattr(subprocess_class, 'stop', stop)
+
+    pool = DashSubprocessPool()
+    with pytest.raises(OSError):
+        pool.start(None, 'test_apps.simple_app')
+    assert len(stopped) == 1
+    assert not pool.servers
+
+    # A dead server is stopped before a new one is started.
+    dead = subprocess_class(None)
+    dead.process = _DeadProcess()
+    pool.servers[('test_apps.simple_app', 'app')] = dead
+    with pytest.raises(OSError):
+        pool.start(None, 'test_apps.simple_app')
+    assert stopped[1] is dead
+    assert len(stopped) == 3
+
+
+class _LiveProcess(object):
+    @staticmethod
+    def poll():
+        return None
+
+
+def test_subprocess_pool_ports(monkeypatch):
+    started = []
+    stopped = []
+
+    def start(self, app_module, *_, port='auto', **__):
+        self.port = self._resolve_port(port)
+        self.process = _LiveProcess()
+        started.append((app_module, self.port))
+
+    def stop(self):
+        stopped.append(self)
+
+    subprocess_class = application_runners.DashSubprocess
+    monkeypatch.setattr(subprocess_class, 'start', start)
+    monkeypatch.setattr(subprocess_class, 'stop', stop)
+    monkeypatch.setattr(subprocess_class, 'reload', lambda self: None)
+
+    pool = DashSubprocessPool()
+    port = find_free_port()
+    first = pool.start(None, 'first_app', port=port)
+    assert pool.start(None, 'first_app', port='auto') is first
+    assert pool.start(None, 'first_app', port=port) is first
+
+    # Another app on the same port replaces the first server.
+    second = pool.start(None, 'second_app', port=port)
+    assert stopped == [first]
+    assert list(pool.servers.values()) == [second]
+
+    # The same app on another port is restarted.
+    other_port = find_free_port()
+    third = pool.start(None, 'second_app', port=other_port)
+    assert stopped == [first, second]
+    assert third.port == other_port
+
+    # A port used outside of the pool.
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.bind(('127.0.0.1', port))
+        sock.listen(1)
+        with pytest.raises(PortAllocationError):
+            pool.start(None, 'first_app', port=port)
+    finally:
+        sock.close()
+    assert started == [('first_app', port), ('second_app', port),
+                       ('second_app', other_port)]
+
+
+def test_subprocess_crash_fails_fast():
+    runner = application_runners.DashSubprocess(None)
+    start = time.time()
+    with pytest.raises(DashAppLoadingError) as err:
+        runner.start('test_apps.does_not_exist', port='auto')
+    runner.stop()
+
+    assert time.time() - start < 5
+    assert 'exited with status' in str(err.value)
+    assert 'does_not_exist' in str(err.value)
+
+
+class _Config(object):
+    serve_locally = False
+
+
+class _Resources(object):
+    def __init__(self):
+        self.config = _Config()
+
+
+class _App(object):
+    def __init__(self):
+        self.scripts = _Resources()
+        self.css = _Resources()
+        self.server = None
+
+
+class _Server(object):
+    def __init__(self, backend, threads):
+        self.backend = backend
+        self.threads = threads
+        self.stopped = threading.Event()
+
+    def serve_forever(self):
+        self.stopped.wait()
+
+    def shutdown(self):
+        self.stopped.set()
+
+
+def _create_server(backend, app, host, port, threads):
+    # pylint: disable=unused-argument
+    return _Server(backend, threads)
+
+
+def _app_started(*_, **__):
+    pass
+
+
+def test_threaded_restart_on_new_arguments(monkeypatch):
+    monkeypatch.setattr(application_runners, 'create_server', _create_server)
+    monkeypatch.setattr(
+        application_runners, '_wait_for_client_app_started', _app_started
+    )
+    monkeypatch.setattr(
+        application_runners, '_wait_for_server_closed', lambda *_: True
+    )
+    app = _App()
+    runner = application_runners.DashThreaded(None)
+    with pytest.raises(ServerNotStartedError):
+        runner.reset()
+
+    with runner:
+        runner(app, port='auto')
+        server = runner.server
+        runner(app, port='auto')
+        runner(app, port=runner.port)
+        assert runner.server is server
+
+        runner(app, port='auto', backend='waitress', threads=2)
+        assert server.stopped.is_set()
+        assert (runner.server.backend, runner.server.threads) == \
+            ('waitress', 2)
+
+        server = runner.server
+        port = find_free_port()
+        runner(app, port=port, backend='waitress', threads=2)
+        assert server.stopped.is_set()
+        assert runner.port == port
+    assert runner.server.stopped.is_set()
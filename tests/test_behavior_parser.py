@@ -0,0 +1,56 @@
+# pylint: disable=missing-docstring
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+
+from pytest_dash import behavior_parser
+from pytest_dash.behavior_parser import BehaviorTransformer
+
+
+class _FakeDriver(object):
+    """Driver with a single element, replaced when it goes stale."""
+
+    def __init__(self):
+        self.finds = 0
+        self.stale = set()
+        self.commands = []
+
+    def find_element(self, *_):
+        self.finds += 1
+        return WebElement(self, str(self.finds))
+
+    def execute(self, command, params):
+        if params['id'] in self.stale:
+            raise StaleElementReferenceException()
+        self.commands.append((command, params['id']))
+        return {'value': None}
+
+
+def test_behavior_element_cache():
+    driver = _FakeDriver()
+    transformer = BehaviorTransformer(driver)
+
+    first = transformer.element_id('#out')
+    assert transformer.element_id('#out') is first
+    assert driver.finds == 1
+
+    # The stale element is found again and the command retried.
+    driver.stale.add(first.id)
+    transformer.click(first)
+    assert driver.finds == 2
+    assert driver.commands[-1][1] == '2'
+
+    # Commands clear the cache.
+    assert transformer.element_id('#out') is not first
+    assert driver.finds == 3
+
+
+def test_wait_for_callbacks_command(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        behavior_parser, 'wait_for_callbacks_idle', calls.append
+    )
+    driver = _FakeDriver()
+    parser = behavior_parser.parser_factory(driver)
+    parser.parse('wait for callbacks')
+    parser.parse('Wait For Callbacks')
+    assert calls == [driver, driver]
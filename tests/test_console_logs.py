@@ -0,0 +1,111 @@
+# pylint: disable=missing-docstring, too-few-public-methods
+from pytest_dash.drivers import (
+    ConsoleLogCollector, attach_console_logs, drain_console_logs
+)
+
+
+class _LogDriver(object):
+    def __init__(self):
+        self.logs = []
+        self.reads = 0
+
+    def get_log(self, _):
+        self.reads += 1
+        logs, self.logs = self.logs, []
+        return logs
+
+
+def test_console_collector_bounded_and_throttled():
+    driver = _LogDriver()
+    collector = ConsoleLogCollector(max_entries=2, interval=60)
+    attach_console_logs(driver, collector)
+
+    driver.logs = [
+        {
+            'level': 'INFO',
+            'message': 'first'
+        },
+        {
+            'level': 'SEVERE',
+            'message': 'second'
+        },
+        {
+            'level': 'WARNING',
+            'message': 'third'
+        },
+    ]
+    assert drain_console_logs(driver) is collector
+    assert [x['message'] for x in collector.entries()] == ['second', 'third']
+    assert [x['message'] for x in collector.severe()] == ['second']
+
+    # The next read is throttled unless forced.
+    driver.logs = [{'level': 'INFO', 'message': 'fourth'}]
+    drain_console_logs(driver)
+    assert driver.reads == 1
+    drain_console_logs(driver, force=True)
+    assert driver.reads == 2
+    assert collector.entries()[-1]['message'] == 'fourth'
+
+    collector.clear()
+    assert not collector.entries()
+
+
+def test_console_logs_without_collector():
+    assert drain_console_logs(_LogDriver()) is None
+
+
+def test_fail_on_console_errors(testdir):
+    testdir.makeconftest(
+        '''
+        import pytest
+        from pytest_dash.drivers import (
+            ConsoleLogCollector, attach_console_logs
+        )
+        from pytest_dash.plugin import _plugin
+
+
+        class FakeDriver(object):
+            logs = []
+
+            def get_log(self, _):
+                logs, FakeDriver.logs = FakeDriver.logs, []
+                return logs
+
+            def quit(self):
+                pass
+
+
+        def create_driver():
+            driver = FakeDriver()
+            attach_console_logs(driver, ConsoleLogCollector())
+            return driver
+
+
+        @pytest.hookimpl(trylast=True)
+        def pytest_configure(config):
+            _plugin.driver_pool.factory = create_driver
+        '''
+    )
+    testdir.makepyfile(
+        '''
+        from pytest_dash.plugin import _plugin
+
+
+        def _log(level, message):
+            with _plugin.driver_pool.driver() as driver:
+                driver.logs.append({'level': level, 'message': message})
+
+
+        def test_warning():
+            _log('WARNING', 'just a warning')
+
+
+        def test_severe():
+            _log('SEVERE', 'callback error boom')
+        '''
+    )
+    result = testdir.runpytest_subprocess(
+        '--dash-fail-on-console-errors', 'true'
+    )
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(['*callback error boom*'])
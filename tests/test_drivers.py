@@ -0,0 +1,277 @@
+# pylint: disable=missing-docstring, protected-access
+import threading
+import time
+
+import pytest
+
+from pytest_dash.drivers import DriverPool, browser_options
+from pytest_dash.errors import DriverPoolTimeoutError
+from pytest_dash.plugin import DashPlugin
+
+
+def test_driver_pool_reuse_in_thread():
+    pool = DriverPool(object, size=1)
+
+    with pool.driver() as first:
+        with pool.driver() as second:
+            assert first is second
+
+    with pool.driver() as third:
+        assert third is first
+    assert len(pool.drivers) == 1
+
+
+def test_driver_pool_size():
+    pool = DriverPool(object, size=1)
+    results = []
+
+    def other_thread():
+        try:
+            pool.acquire(timeout=0.1)
+        except DriverPoolTimeoutError as err:
+            results.append(err)
+
+    with pool.driver():
+        thread = threading.Thread(target=other_thread)
+        thread.start()
+        thread.join()
+
+    assert len(results) == 1
+
+    thread = threading.Thread(target=lambda: results.append(pool.acquire()))
+    thread.start()
+    thread.join()
+    assert results[-1] is pool.drivers[0]
+
+
+def test_plugin_driver_not_pinned():
+    plugin = DashPlugin()
+    plugin.driver_pool = DriverPool(object, size=1)
+
+    with plugin.driver_pool.driver() as driver:
+        assert plugin.driver is driver
+        assert plugin.driver_pool.current() is driver
+    assert plugin.driver_pool.current() is None
+
+    with pytest.warns(DeprecationWarning):
+        assert plugin.driver is driver
+    # The driver was returned to the pool.
+    results = []
+    thread = threading.Thread(
+        target=lambda: results.append(plugin.driver_pool.acquire(timeout=1))
+    )
+    thread.start()
+    thread.join()
+    assert results == [driver]
+
+
+def test_driver_pool_factory_error():
+    def factory():
+        raise ValueError('No browser')
+
+    pool = DriverPool(factory, size=1)
+    with pytest.raises(ValueError):
+        pool.acquire()
+    with pytest.raises(ValueError):
+        pool.acquire()
+
+
+class _Driver(object):
+    def __init__(self, broken=False):
+        self.broken = broken
+        self.calls = []
+        self.quitted = False
+
+    def execute_script(self, *_):
+        if self.broken:
+            raise RuntimeError('Browser crashed')
+        self.calls.append('script')
+
+    def delete_all_cookies(self):
+        self.calls.append('cookies')
+
+    def get(self, url):
+        self.calls.append(url)
+
+    def quit(self):
+        self.quitted = True
+
+
+class _Item(object):  # pylint: disable=too-few-public-methods
+    funcargs = {}
+
+
+class _Runner(object):  # pylint: disable=too-few-public-methods
+    def __init__(self, driver):
+        self.driver = driver
+
+
+def test_driver_pool_discard():
+    pool = DriverPool(_Driver, size=1)
+    with pool.driver() as broken:
+        pool.discard(broken)
+        assert pool.current() is None
+
+    assert broken.quitted
+    with pool.driver() as driver:
+        assert driver is not broken
+
+
+def test_driver_pool_replace_held():
+    pool = DriverPool(_Driver, size=1)
+    broken = pool.acquire()
+    pool.acquire()
+
+    driver = pool.replace(broken)
+    assert broken.quitted
+    assert driver is not broken
+    assert pool.drivers == [driver]
+    with pool.driver() as current:
+        assert current is driver
+
+    # Releasing the broken driver releases its replacement.
+    pool.release(broken)
+    pool.release(broken)
+    assert pool.current() is None
+    results = []
+    thread = threading.Thread(
+        target=lambda: results.append(pool.acquire(timeout=1))
+    )
+    thread.start()
+    thread.join()
+    assert results == [driver]
+
+
+def test_plugin_reset_held_drivers(monkeypatch):
+    plugin = DashPlugin()
+    plugin.driver_pool = DriverPool(_Driver, size=1)
+    item = _Item()
+
+    # A driver kept by a module fixture is reset after every test.
+    driver = plugin.driver_pool.acquire()
+    runner = _Runner(driver)
+    monkeypatch.setattr('pytest_dash.plugin._item_runners', lambda _: [runner])
+    plugin._reset_item_drivers(item)
+    plugin._reset_item_drivers(item)
+    assert driver.calls == ['script', 'cookies', 'about:blank'] * 2
+
+    # The module runner gets a new driver when the reset fails.
+    driver.broken = True
+    plugin._reset_item_drivers(item)
+    assert driver.quitted
+    assert runner.driver is not driver
+    assert plugin.driver_pool.drivers == [runner.driver]
+    with plugin.driver_pool.driver() as current:
+        assert current is runner.driver
+    plugin._reset_item_drivers(item)
+    assert runner.driver.calls == ['script', 'cookies', 'about:blank']
+    plugin.driver_pool.release(driver)
+    assert plugin.driver_pool.current() is None
+
+
+def test_browser_options_chrome(tmpdir):
+    kwargs, profile = browser_options(
+        'Chrome',
+        headless=True,
+        window_size=(1280, 720),
+        page_load_strategy='eager',
+        disable_images=True,
+        disable_extensions=True,
+        profile_dir=str(tmpdir)
+    )
+    options = kwargs['options']
+    assert '--headless' in options.arguments
+    assert '--window-size=1280,720' in options.arguments
+    assert '--disable-extensions' in options.arguments
+    assert '--user-data-dir={}'.format(profile) in options.arguments
+    assert profile.startswith(str(tmpdir))
+    assert options.to_capabilities()['pageLoadStrategy'] == 'eager'
+
+
+def test_browser_options_firefox():
+    kwargs, profile = browser_options(
+        'Firefox', headless=True, window_size=(800, 600), disable_images=True
+    )
+    options = kwargs['options']
+    assert profile is None
+    assert '-headless' in options.arguments
+    assert '--width=800' in options.arguments
+    assert options.preferences['permissions.default.image'] == 2
+
+
+def test_browser_options_opera():
+    kwargs, _ = browser_options(
+        'Opera', headless=True, page_load_strategy='eager'
+    )
+    options = kwargs['options']
+    assert '--headless' in options.arguments
+    assert options.to_capabilities()['pageLoadStrategy'] == 'eager'
+
+
+def test_browser_options_capabilities():
+    kwargs, profile = browser_options('Safari', page_load_strategy='none')
+    capabilities = kwargs['desired_capabilities']
+    assert profile is None
+    assert capabilities['browserName'] == 'safari'
+    assert capabilities['pageLoadStrategy'] == 'none'
+
+    kwargs, _ = browser_options('Edge', page_load_strategy='eager')
+    assert kwargs['capabilities']['pageLoadStrategy'] == 'eager'
+    assert browser_options('Remote', window_size=(800, 600)) == ({}, None)
+
+
+def test_browser_options_unsupported():
+    with pytest.warns(UserWarning, match='headless, disable_images'):
+        assert browser_options(
+            'Safari', headless=True, disable_images=True
+        ) == ({}, None)
+
+
+def test_driver_pool_prewarm():
+    created = []
+
+    def factory():
+        time.sleep(0.1)
+        created.append(object())
+        return created[-1]
+
+    pool = DriverPool(factory, size=2)
+    threads = pool.prewarm(3)
+    assert len(threads) == 2
+
+    first = pool.acquire(timeout=1)
+    assert first in created
+    second = threading.Thread(target=pool.acquire)
+    second.start()
+    second.join()
+    assert len(created) == 2
+    assert not pool.prewarm()
+
+
+def test_driver_pool_prewarm_error():
+    def factory():
+        raise ValueError('no browser')
+
+    pool = DriverPool(factory, size=1)
+    pool.prewarm()
+    with pytest.raises(ValueError):
+        pool.acquire(timeout=1)
+    # The slot is free again for the next acquire.
+    with pytest.raises(ValueError):
+        pool.acquire(timeout=1)
+
+
+def test_driver_pool_quit_waits_prewarm():
+    created = []
+
+    def factory():
+        time.sleep(0.1)
+        created.append(_Driver())
+        return created[-1]
+
+    pool = DriverPool(factory, size=2)
+    pool.prewarm(2)
+    pool.quit()
+    assert len(created) == 2
+    assert all(x.quitted for x in created)
+    assert not pool.drivers
@@ -18,6 +18,14 @@ def test_invalid_start_raises_subprocess(dash_subprocess):
         dash_subprocess('test_apps.no_layout_app', port=8051)
 
 
+def test_server_error_raises_before_browser(dash_subprocess):
+
+    with pytest.raises(DashAppLoadingError) as err:
+        dash_subprocess('test_apps.no_layout_app', port='auto')
+
+    assert 'Dash server error' in str(err.value)
+
+
 def test_no_app_found():
     with pytest.raises(NoAppFoundError):
         import_app('test_apps.invalid_app')
@@ -1,4 +1,6 @@
-# pylint: disable=redefined-outer-name, missing-docstring
+# pylint: disable=redefined-outer-name, missing-docstring, unused-argument
+import pytest
+
 try:
     from queue import Queue
 except ImportError:
@@ -14,7 +16,10 @@ import dash_html_components as html
 from pytest_dash.wait_for import \
     wait_for_text_to_equal, wait_for_element_by_css_selector,\
     wait_for_style_to_equal, wait_for_property_to_equal
-from pytest_dash.application_runners import import_app
+from pytest_dash.drivers import reset_browser
+from pytest_dash.plugin import _plugin
+from pytest_dash.application_runners import \
+    import_app, DashSubprocessPool
 
 
 def test_dash_threaded(dash_threaded):
@@ -94,3 +99,144 @@ def test_different_application_name_subprocess(dash_subprocess):
         'test_apps.different_app_name', application_name='different'
     )
     wait_for_text_to_equal(dash_subprocess.driver, '#body', 'Different')
+
+
+def test_auto_port(dash_threaded):
+    app = import_app('test_apps.simple_app')
+    dash_threaded(app, port='auto')
+
+    assert isinstance(dash_threaded.port, int)
+    assert dash_threaded.url in dash_threaded.driver.current_url
+
+
+def test_subprocess_pool(dash_subprocess):
+    driver = dash_subprocess.driver
+    pool = DashSubprocessPool()
+    try:
+        first = pool.start(driver, 'test_apps.simple_app')
+        second = pool.start(driver, 'test_apps.simple_app')
+        assert first is second
+        assert first.url in driver.current_url
+    finally:
+        pool.stop()
+
+    assert first.process.poll() is not None
+
+
+def test_threaded_module_reuse(dash_threaded_module):
+    app = dash.Dash(__name__)
+    app.layout = html.Div('First', id='body')
+    resets = []
+
+    dash_threaded_module(app, port='auto')
+    thread = dash_threaded_module.thread
+
+    # Starting the same app only reload the page.
+    dash_threaded_module(app, port='auto')
+    assert dash_threaded_module.thread is thread
+
+    dash_threaded_module.reset_hooks.append(resets.append)
+    dash_threaded_module.reset(layout=html.Div('Second', id='body'))
+
+    assert resets == [app]
+    wait_for_text_to_equal(dash_threaded_module.driver, '#body', 'Second')
+
+
+@pytest.fixture
+def reset_browser_module(monkeypatch):
+    monkeypatch.setitem(_plugin.settings, 'reset_browser', True)
+
+
+def test_reset_browser_module_first(
+        reset_browser_module, dash_threaded_module
+):
+    dash_threaded_module(import_app('test_apps.simple_app'), port='auto')
+    driver = dash_threaded_module.driver
+    driver.execute_script('window.localStorage.setItem("foo", "bar")')
+    driver.add_cookie({'name': 'foo', 'value': 'bar'})
+
+
+def test_reset_browser_module_second(
+        reset_browser_module, dash_threaded_module
+):
+    dash_threaded_module(import_app('test_apps.simple_app'), port='auto')
+    driver = dash_threaded_module.driver
+    assert driver.execute_script(
+        'return window.localStorage.getItem("foo")'
+    ) is None
+    assert driver.get_cookie('foo') is None
+
+
+def test_in_process_chained_callbacks(dash_in_process):
+    app = dash.Dash(__name__)
+    app.layout = html.Div([
+        html.Button('click me', id='clicker'),
+        html.Div(id='first'),
+        html.Div(id='second'),
+    ])
+
+    @app.callback(Output('first', 'children'), [Input('clicker', 'n_clicks')])
+    def on_click(n_clicks):
+        if n_clicks is None:
+            raise PreventUpdate
+        return 'Clicked {}'.format(n_clicks)
+
+    @app.callback(Output('second', 'children'), [Input('first', 'children')])
+    def on_first(first):
+        if first is None:
+            raise PreventUpdate
+        return first.upper()
+
+    dash_in_process(app)
+    assert dash_in_process.get_prop('second', 'children') is None
+
+    dash_in_process.set_prop('clicker', 'n_clicks', 2)
+    assert dash_in_process.get_prop('first', 'children') == 'Clicked 2'
+    assert dash_in_process.get_prop('second', 'children') == 'CLICKED 2'
+
+
+def test_subprocess_output(dash_subprocess):
+    dash_subprocess('test_apps.simple_app', port='auto')
+
+    assert 'Serving on' in dash_subprocess.get_output()
+    assert dash_subprocess.report_sections()
+
+
+@pytest.mark.parametrize('backend', ['werkzeug', 'waitress', 'wsgiref'])
+def test_threaded_backends(dash_threaded, backend):
+    app = import_app('test_apps.simple_app')
+    dash_threaded(app, port='auto', backend=backend)
+    driver = dash_threaded.driver
+
+    value_input = wait_for_element_by_css_selector(driver, '#value')
+    value_input.send_keys(backend)
+
+    wait_for_text_to_equal(driver, '#out', backend)
+
+
+def test_dash_load(dash_threaded, dash_load):
+    app = import_app('test_apps.simple_app')
+    dash_threaded(app, port='auto', backend='waitress', threads=8)
+
+    payload = dash_load.payload(
+        dash_threaded, 'out.children', {'value.value': 'Hello'}
+    )
+    result = dash_load(dash_threaded, [payload], repeat=50, workers=8)
+
+    assert result.count == 50
+    result.assert_no_errors()
+    result.assert_latency(p99=5)
+
+
+def test_reset_browser(dash_threaded):
+    dash_threaded(import_app('test_apps.simple_app'), port='auto')
+    driver = dash_threaded.driver
+    driver.execute_script('window.localStorage.setItem("foo", "bar")')
+
+    reset_browser(driver)
+    assert driver.current_url == 'about:blank'
+
+    dash_threaded.reload()
+    assert driver.execute_script(
+        'return window.localStorage.getItem("foo")'
+    ) is None
@@ -0,0 +1,41 @@
+# pylint: disable=missing-docstring
+import subprocess
+import sys
+
+import pytest
+
+_heavy_modules = (
+    'selenium', 'dash', 'flask', 'requests', 'werkzeug', 'waitress', 'ruamel',
+    'lark'
+)
+
+
+def _run_python(*args):
+    return subprocess.check_output((sys.executable, ) + args,
+                                   stderr=subprocess.STDOUT).decode('utf-8')
+
+
+def test_plugin_lazy_imports():
+    output = _run_python(
+        '-c', 'import sys, pytest, pytest_dash.plugin\n'
+        'print(sorted(m for m in {!r} if m in sys.modules))'.
+        format(_heavy_modules)
+    )
+    assert output.strip() == '[]'
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 7), reason='-X importtime requires python 3.7'
+)
+def test_plugin_import_time():
+    # Import pytest first, only the plugin own cost is measured.
+    output = _run_python(
+        '-X', 'importtime', '-c', 'import pytest; import pytest_dash.plugin'
+    )
+    line = next(
+        x for x in output.splitlines()
+        if x.rstrip().endswith('| pytest_dash.plugin')
+    )
+    cumulative = int(line.split('|')[1])
+    # Microseconds, generous for slow CI machines.
+    assert cumulative < 100000, line
@@ -0,0 +1,108 @@
+# pylint: disable=missing-docstring
+import io
+import json
+
+import pytest
+from werkzeug.test import Client
+from werkzeug.wrappers import BaseResponse
+
+from pytest_dash.application_runners import import_app
+from pytest_dash.instrumentation import (
+    RequestLog, RequestRecorder, RequestRecord
+)
+
+
+def test_request_recorder(tmpdir):
+    app = import_app('test_apps.simple_app')
+    log = RequestLog()
+    path = str(tmpdir.join('requests.jsonl'))
+    client = Client(
+        RequestRecorder(app.server, log=log, path=path), BaseResponse
+    )
+
+    client.get('/_dash-layout', buffered=True)
+    payload = {
+        'output': 'out.children',
+        'outputs': {
+            'id': 'out',
+            'property': 'children'
+        },
+        'inputs': [{
+            'id': 'value',
+            'property': 'value',
+            'value': 'Hello'
+        }],
+        'changedPropIds': ['value.value'],
+    }
+    response = client.post(
+        '/_dash-update-component',
+        data=json.dumps(payload),
+        content_type='application/json',
+        buffered=True
+    )
+    assert response.status_code == 200
+
+    records = log.records
+    assert [x.kind for x in records] == ['layout', 'callback']
+    callback = records[1]
+    assert callback.callback == 'out.children'
+    assert callback.status == 200
+    assert callback.response_size == len(response.data)
+    assert list(log.callbacks()) == ['out.children']
+    assert 'out.children: 1 calls' in log.summary()
+
+    # The same records are written to the file.
+    assert RequestLog(path).records == records
+
+
+def test_request_log_file(tmpdir):
+    path = tmpdir.join('requests.jsonl')
+    record = RequestRecord(
+        start=1.0,
+        method='POST',
+        path='/_dash-update-component',
+        kind='callback',
+        callback='out.children',
+        status=200,
+        request_size=10,
+        response_size=2000,
+        duration=0.1
+    )
+    line = json.dumps(record._asdict())
+    with io.open(str(path), 'w') as f:
+        f.write(line + '\n' + line[:10])
+
+    log = RequestLog(str(path))
+    assert log.records == [record]
+    with io.open(str(path), 'a') as f:
+        f.write(line[10:] + '\n')
+    assert len(log.records) == 2
+    assert len(log.since(2.0)) == 0
+
+    with pytest.raises(AssertionError, match='out.children'):
+        log.assert_response_size(1000)
+
+    log.close()
+    assert not path.exists()
+    assert len(log.records) == 2
+
+
+def test_request_log_clear_pending(tmpdir):
+    path = tmpdir.join('requests.jsonl')
+    record = RequestRecord(
+        start=1.0,
+        method='GET',
+        path='/_dash-layout',
+        kind='layout',
+        callback=None,
+        status=200,
+        request_size=0,
+        response_size=100,
+        duration=0.1
+    )
+    path.write(json.dumps(record._asdict()) + '\n')
+
+    # The records written before the clear are not loaded afterwards.
+    log = RequestLog(str(path))
+    log.clear()
+    assert not log.records
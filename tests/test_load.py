@@ -0,0 +1,62 @@
+# pylint: disable=missing-docstring, too-few-public-methods
+import threading
+
+import requests
+
+from pytest_dash import load
+from pytest_dash.load import DashLoad, percentile
+from pytest_dash.servers import create_server
+from pytest_dash.application_runners import find_free_port
+
+
+def test_percentile():
+    values = list(range(1, 101))
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 100) == 100
+    assert percentile([], 50) is None
+
+
+class _Runner(object):
+    def __init__(self, url):
+        self.url = url
+
+
+def _app(_, start_response):
+    start_response('200 OK', [('Content-Type', 'application/json')])
+    return [b'{}']
+
+
+def test_load_closes_sessions(monkeypatch):
+    sessions = []
+    original_close = requests.Session.close
+
+    def close(session):
+        sessions.append(session)
+        original_close(session)
+
+    monkeypatch.setattr(requests.Session, 'close', close)
+
+    port = find_free_port()
+    server = create_server('waitress', _app, '127.0.0.1', port)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        runner = _Runner('http://127.0.0.1:{}'.format(port))
+        result = DashLoad()(runner, [{}], repeat=20, workers=4)
+    finally:
+        server.shutdown()
+        thread.join(5)
+
+    result.assert_no_errors()
+    assert result.count == 20
+    assert 1 <= len(sessions) <= 4
+
+    # pylint: disable=protected-access
+    thread_sessions = load._ThreadSessions()
+    first = thread_sessions.get()
+    assert thread_sessions.get() is first
+    thread_sessions.close()
+    assert sessions[-1] is first
+    assert not thread_sessions.sessions
@@ -0,0 +1,368 @@
+# pylint: disable=missing-docstring, protected-access, too-few-public-methods
+import json
+import shutil
+import subprocess
+import time
+
+import pytest
+from selenium.common.exceptions import (
+    NoSuchElementException, StaleElementReferenceException, TimeoutException,
+    WebDriverException
+)
+
+from pytest_dash import scripts, wait_for, wait_report
+from pytest_dash.application_runners import find_free_port
+from pytest_dash.errors import DashAppLoadingError
+from pytest_dash.wait_for import (
+    wait_for_all, wait_for_any, element_present, text_to_equal,
+    property_to_equal, style_to_equal
+)
+
+
+class _ScriptDriver(object):
+    """Fake driver returning the next results on every script call."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    def execute_script(self, _, specs):
+        self.calls += 1
+        results = self.results[min(self.calls, len(self.results)) - 1]
+        assert len(results) == len(specs)
+        return results
+
+
+def _found(value=None):
+    return {'found': True, 'value': value}
+
+
+_missing = {'found': False, 'value': None}
+
+
+def test_wait_for_all_single_call_per_poll():
+    driver = _ScriptDriver(
+        [_missing, _found('Hello'),
+         _found('rgb(255, 0, 0)')],
+        [_found(), _found('Hello'),
+         _found('rgb(255, 0, 0)')],
+    )
+    values = wait_for_all(
+        driver, [
+            element_present('#out'),
+            text_to_equal('#out', 'Hello'),
+            style_to_equal('#out', 'color', 'rgba(255, 0, 0, 1)'),
+        ],
+        timeout=2
+    )
+    assert driver.calls == 2
+    assert values == [None, 'Hello', 'rgb(255, 0, 0)']
+
+
+def test_wait_for_any():
+    first = property_to_equal('#input', 'value', 1)
+    second = property_to_equal('#input', 'value', 2)
+    driver = _ScriptDriver([_found(2), _found(2)])
+    assert wait_for_any(driver, [first, second], timeout=1) is second
+
+
+def test_wait_for_all_timeout():
+    driver = _ScriptDriver([_found('Hello')])
+    with pytest.raises(TimeoutException) as err:
+        wait_for_all(driver, [text_to_equal('#out', 'Bye')], timeout=0.1)
+    assert "last value: 'Hello'" in str(err.value)
+
+
+def test_element_text_script():
+    # shutil.which is python 3 only.
+    node = shutil.which('node') if hasattr(shutil, 'which') else None
+    if not node:
+        pytest.skip('node is not installed')
+    # Html elements have an innerText, svg elements only a textContent.
+    elements = [{'innerText': ' Hello '}, {'textContent': ' Bye '}]
+    program = (
+        'var elementValue = function() {{ {} }};'
+        'console.log(JSON.stringify({}.map(function (element) {{'
+        '    return elementValue(element, "text");'
+        '}})));'
+    ).format(scripts.element_value, json.dumps(elements))
+    output = subprocess.check_output([node, '-e', program])
+    assert json.loads(output.decode('utf-8')) == ['Hello', 'Bye']
+
+
+class _AsyncScriptDriver(_ScriptDriver):
+    def __init__(self, *results):
+        super(_AsyncScriptDriver, self).__init__(*results)
+        self.capabilities = {'timeouts': {'script': 10000}}
+        self.script_timeouts = []
+        self.signatures = []
+
+    def set_script_timeout(self, timeout):
+        self.script_timeouts.append(timeout)
+
+    def execute_async_script(self, _, specs, previous, timeout):
+        assert timeout <= 500
+        self.signatures.append(previous)
+        results = self.execute_script(None, specs)
+        return {'results': results, 'signature': str(self.calls)}
+
+
+def test_wait_for_observer_mode(monkeypatch):
+    monkeypatch.setattr(wait_for._settings, 'mode', 'observer')
+    driver = _AsyncScriptDriver([_missing], [_found('Hello')])
+    wait_for.wait_for_text_to_equal(driver, '#out', 'Hello', timeout=2)
+    assert driver.calls == 2
+    # The last signature is sent back to wait for a change.
+    assert driver.signatures == [None, '1']
+    # The session script timeout is restored after the wait.
+    assert len(driver.script_timeouts) == 2
+    assert driver.script_timeouts[-1] == 10
+
+    element = object()
+    driver = _AsyncScriptDriver([_found(element)])
+    assert wait_for.wait_for_element_by_id(driver, 'out') is element
+
+
+def test_wait_for_observer_fallback(monkeypatch):
+    monkeypatch.setattr(wait_for._settings, 'mode', 'observer')
+
+    class _NoAsyncDriver(_ScriptDriver):
+        attempts = 0
+
+        def set_script_timeout(self, _):
+            self.attempts += 1
+            raise WebDriverException('Not supported')
+
+    driver = _NoAsyncDriver([_missing], [_found('Hello')])
+    wait_for.wait_for_all(driver, [text_to_equal('#out', 'Hello')], timeout=2)
+    assert driver.calls == 2
+    # The driver is polled without trying the async script again.
+    wait_for.wait_for_all(driver, [text_to_equal('#out', 'Hello')], timeout=2)
+    assert driver.attempts == 1
+
+
+def test_wait_for_settings(monkeypatch):
+    monkeypatch.setattr(wait_for._settings, 'timeout', 0.2)
+    monkeypatch.setattr(wait_for._settings, 'poll_frequency', 0.05)
+    polls = []
+
+    def never(_):
+        polls.append(time.time())
+        return False
+
+    start = time.time()
+    with pytest.raises(TimeoutException):
+        wait_for._wait_for(_ScriptDriver(), never)
+    assert time.time() - start < 1
+    assert len(polls) > 2
+
+
+def test_wait_for_backoff(monkeypatch):
+    monkeypatch.setattr(wait_for._settings, 'backoff', True)
+    monkeypatch.setattr(wait_for._settings, 'poll_frequency', 0.2)
+    polls = []
+
+    def sixth_time(_):
+        polls.append(time.time())
+        if len(polls) < 2:
+            raise NoSuchElementException()
+        return len(polls) == 6
+
+    assert wait_for._wait_for(_ScriptDriver(), sixth_time, timeout=5)
+    delays = [b - a for a, b in zip(polls, polls[1:])]
+    # The delay doubles from 10ms up to the poll frequency.
+    assert delays[0] < 0.05
+    assert delays[-1] > delays[0]
+    assert max(delays) < 0.3
+
+
+def test_wait_for_text_single_script_per_poll():
+    driver = _ScriptDriver([_missing], [_found('Hello')])
+    wait_for.wait_for_text_to_equal(driver, '#out', 'Hello', timeout=2)
+    assert driver.calls == 2
+
+
+def test_element_condition_stale():
+    class _ElementDriver(object):
+        def __init__(self):
+            self.calls = []
+
+        def execute_script(self, _, element, kind, name):
+            self.calls.append((kind, name))
+            if element == 'stale':
+                raise StaleElementReferenceException()
+            return 'rgb(0, 0, 255)'
+
+    driver = _ElementDriver()
+    condition = wait_for._element_condition('stale', 'text', lambda x: True)
+    assert condition(driver) is False
+
+    condition = wait_for._element_condition(
+        'element', 'style', lambda x: x == 'rgba(0, 0, 255, 1)', name='color'
+    )
+    assert condition(driver) is True
+    assert driver.calls == [('text', None), ('style', 'color')]
+
+
+def test_wait_for_callbacks_idle():
+    class _CallbacksDriver(object):
+        def __init__(self, *states):
+            self.states = list(states)
+
+        def execute_script(self, _):
+            return self.states.pop(0) if len(self.states) > 1 \
+                else self.states[0]
+
+    driver = _CallbacksDriver(
+        {
+            'pending': 1,
+            'total': 1,
+            'idle': 0,
+            'loading': 0
+        },
+        {
+            'pending': 0,
+            'total': 1,
+            'idle': 10,
+            'loading': 1
+        },
+        {
+            'pending': 0,
+            'total': 2,
+            'idle': 500,
+            'loading': 0
+        },
+    )
+    assert wait_for.wait_for_callbacks_idle(driver, timeout=5) == 2
+    assert not driver.states[1:]
+
+    driver = _CallbacksDriver({'pending': 1, 'total': 1, 'idle': 0})
+    with pytest.raises(TimeoutException):
+        wait_for.wait_for_callbacks_idle(driver, timeout=0.1)
+
+
+def test_wait_recorder(monkeypatch, tmpdir):
+    recorder = wait_report.WaitRecorder()
+    recorder.enabled = True
+    monkeypatch.setattr(wait_for, 'wait_recorder', recorder)
+    monkeypatch.setattr(wait_for._settings, 'poll_frequency', 0.01)
+
+    driver = _ScriptDriver([_missing], [_missing], [_found('Hello')])
+    wait_for.wait_for_text_to_equal(driver, '#out', 'Hello', timeout=2)
+    with pytest.raises(TimeoutException):
+        wait_for.wait_for_all(
+            _ScriptDriver([_missing]), [element_present('#in')], timeout=0.05
+        )
+
+    first, second = recorder.records
+    assert first['condition'] == "text of #out to equal 'Hello'"
+    assert first['polls'] == 3
+    assert not first['timed_out']
+    assert first['timeout'] == 2
+    assert first['nodeid'].endswith('test_wait_recorder')
+    assert second['condition'] == 'element #in'
+    assert second['timed_out']
+    # The test has a timed out wait, it already failed.
+    assert not recorder.closest_to_timeout(5)
+    assert recorder.slowest(1) == [second]
+    assert '2 waits' in recorder.summary()
+
+    path = tmpdir.join('waits.json')
+    recorder.dump(str(path))
+    assert '"element #in"' in path.read()
+
+
+def _record(nodeid, duration, timeout, budget=None):
+    return {
+        'nodeid': nodeid,
+        'condition': 'element #out',
+        'duration': duration,
+        'polls': 1,
+        'timeout': timeout,
+        'budget': budget,
+        'timed_out': False,
+    }
+
+
+def test_wait_recorder_tests_closest_to_timeout():
+    recorder = wait_report.WaitRecorder()
+    recorder.records = [
+        # Many short waits add up against the budget of the test.
+        _record('test_budget', 2, 10, budget=5),
+        _record('test_budget', 2, 10, budget=5),
+        _record('test_single', 3, 10),
+        _record('test_single', 1, 2),
+    ]
+    budget, single = recorder.closest_to_timeout(5)
+    assert budget['nodeid'] == 'test_budget'
+    assert (budget['waits'], budget['duration'], budget['timeout']) == \
+        (2, 4, 5)
+    # Without a budget, the wait closest to its own timeout.
+    assert single['nodeid'] == 'test_single'
+    assert (single['duration'], single['timeout']) == (1, 2)
+
+    summary = recorder.summary()
+    assert '80% of the 5s budget (test_budget)' in summary
+    assert '50% of the 2s wait timeout (test_single)' in summary
+
+
+def test_wait_recorder_nested(monkeypatch):
+    recorder = wait_report.WaitRecorder()
+    recorder.enabled = True
+    monkeypatch.setattr(wait_for, 'wait_recorder', recorder)
+
+    def nested(d):
+        return wait_for._wait_for(d, lambda _: True, timeout=1)
+
+    wait_for._wait_for(_ScriptDriver(), nested, timeout=1)
+    assert [x['condition'] for x in recorder.records] == ['nested']
+
+    recorder.enabled = False
+    wait_for._wait_for(_ScriptDriver(), nested, timeout=1)
+    assert len(recorder.records) == 1
+
+
+@pytest.mark.dash_timeout(5)
+def test_time_budget_marker():
+    assert wait_for._settings.budget == 5
+    assert 0 < wait_for._resolve_timeout(10) <= 5
+    assert wait_for._resolve_timeout(1) == 1
+
+
+def test_time_budget():
+    wait_for.set_time_budget(0.2)
+    try:
+        start = time.time()
+        with pytest.raises(TimeoutException) as err:
+            wait_for._wait_for(_ScriptDriver(), lambda _: False, timeout=10)
+        assert time.time() - start < 1
+        assert 'time budget of 0.2s exceeded' in str(err.value)
+
+        # The budget is exhausted, the app start fails without loading.
+        assert wait_for._resolve_timeout(10) == 0
+        with pytest.raises(DashAppLoadingError):
+            wait_for._wait_for_client_app_started(None, 'http://localhost')
+    finally:
+        wait_for.set_time_budget(None)
+    assert wait_for._resolve_timeout(10) == 10
+
+
+def test_wait_recorder_app_start_errors(monkeypatch):
+    recorder = wait_report.WaitRecorder()
+    recorder.enabled = True
+    monkeypatch.setattr(wait_for, 'wait_recorder', recorder)
+
+    def crashed():
+        raise DashAppLoadingError('Dash subprocess exited')
+
+    url = 'http://localhost:{}'.format(find_free_port())
+    with pytest.raises(DashAppLoadingError):
+        wait_for._wait_for_client_app_started(
+            None, url, timeout=5, check_alive=crashed
+        )
+    with pytest.raises(DashAppLoadingError):
+        wait_for._wait_for_client_app_started(None, url, timeout=0.05)
+
+    crash, timeout = recorder.records
+    assert not crash['timed_out']
+    assert timeout['timed_out']